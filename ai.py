@@ -0,0 +1,66 @@
+# ai.py
+# Piloto simples para as cobras controladas pelo computador: vai atrás da comida mais próxima
+# e vira antes de bater na parede ou em outra cobra. Ele só "aperta as setas" (Snake.request_turn), como um jogador.
+
+import random
+
+import pygame
+
+from settings import WORLD_WIDTH, WORLD_HEIGHT, HEAD_SIZE
+
+class SnakeAI:
+    # Tecla -> direção (dx, dy)
+    MOVES = {
+        pygame.K_UP: (0, -1),
+        pygame.K_DOWN: (0, 1),
+        pygame.K_LEFT: (-1, 0),
+        pygame.K_RIGHT: (1, 0),
+    }
+
+    def __init__(self, snake):
+        self.snake = snake
+        #Distância olhada à frente para desviar das paredes
+        self.lookahead = max(HEAD_SIZE) * 2
+
+    def _is_safe(self, key):
+        """A direção não leva para fora do mundo nem para cima de outra cobra (ou do próprio corpo)."""
+        snake = self.snake
+        dx, dy = self.MOVES[key]
+        x = snake.rect.centerx + dx * self.lookahead
+        y = snake.rect.centery + dy * self.lookahead
+        if not (0 < x < WORLD_WIDTH and 0 < y < WORLD_HEIGHT):
+            return False
+        #Usa a mesma grade da colisão, então só olha o que está perto do ponto à frente
+        area = snake.rect.copy()
+        area.center = (x, y)
+        for (owner, stamp), _ in snake.history_grid.query(area):
+            if owner is not snake:
+                return False
+            index = snake.body_segment_index(stamp)
+            if index is not None and index >= snake.neck_segments:
+                return False
+        return True
+
+    def step(self, foods):
+        """Escolhe a direção deste tick. Chamar antes de Snake.update()."""
+        snake = self.snake
+        head_x, head_y = snake.rect.center
+        if foods:
+            target = min(foods, key=lambda food: (food.rect.centerx - head_x) ** 2 + (food.rect.centery - head_y) ** 2)
+            dx, dy = target.rect.centerx - head_x, target.rect.centery - head_y
+        else:
+            dx, dy = random.choice(list(self.MOVES.values()))
+
+        horizontal = pygame.K_RIGHT if dx > 0 else pygame.K_LEFT
+        vertical = pygame.K_DOWN if dy > 0 else pygame.K_UP
+        preferred = [horizontal, vertical] if abs(dx) > abs(dy) else [vertical, horizontal]
+
+        #Primeiro as direções que aproximam da comida, depois qualquer uma que não leve à parede
+        current = tuple(snake.direction.normalize())
+        for key in preferred + list(self.MOVES):
+            move = self.MOVES[key]
+            if move == (-current[0], -current[1]) or not self._is_safe(key):
+                continue
+            if move != current:
+                snake.request_turn(key)
+            return
\ No newline at end of file
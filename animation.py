@@ -0,0 +1,43 @@
+# animation.py
+# Animações das sprites. As sequências de frames ficam no JSON da spritesheet, em "animations":
+#   "body": {"frames": ["body", "body2"], "frame_time": 4}
+# Todos os frames são escalados para o tamanho do objeto (na resolução interna de desenho) e convertidos para o formato da tela uma única vez,
+# no carregamento. Durante o jogo, trocar de frame é só pegar um item da lista (nenhum transform por frame).
+
+import pygame
+
+from settings import HEAD_SIZE, BODY_SIZE, FOOD_SIZE
+from camera import to_render_size
+
+# Tamanho final de cada tipo de sprite
+ANIMATION_SIZES = {'head': HEAD_SIZE, 'body': BODY_SIZE, 'food': FOOD_SIZE}
+
+class Animation:
+    def __init__(self, frames, frame_time):
+        self.frames = frames
+        self.frame_time = frame_time # Quantos ticks do jogo cada frame fica na tela
+
+    def frame(self, tick, offset=0):
+        """Frame a ser mostrado no tick atual. 'offset' defasa a animação (ex: um segmento do corpo em relação ao outro)."""
+        return self.frames[(tick // self.frame_time + offset) % len(self.frames)]
+
+def load_animations(spritesheet):
+    """Lê as animações do JSON da spritesheet e já deixa todos os frames prontos para desenhar."""
+    animations = {}
+    for name, anim_data in spritesheet.data.get('animations', {}).items():
+        #O tamanho vem do tipo da sprite ("size": "body"), por padrão o próprio nome da animação
+        size_name = anim_data.get('size', name)
+        if not isinstance(size_name, str) or size_name not in ANIMATION_SIZES:
+            #Só essa animação fica de fora, o resto da spritesheet continua valendo
+            print(f"Aviso: animação '{name}' ignorada, tamanho desconhecido: {size_name!r} "
+                  f"(use {', '.join(ANIMATION_SIZES)})")
+            continue
+        size = to_render_size(ANIMATION_SIZES[size_name])
+        try:
+            frames = [pygame.transform.scale(spritesheet.parse_sprite(frame_name), size).convert_alpha()
+                      for frame_name in anim_data['frames']]
+        except (KeyError, TypeError) as e:
+            print(f"Aviso: animação '{name}' ignorada, frames inválidos: {e}")
+            continue
+        animations[name] = Animation(frames, anim_data.get('frame_time', 1))
+    return animations
\ No newline at end of file
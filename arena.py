@@ -0,0 +1,159 @@
+# arena.py
+# Várias cobras (jogadores ou computador) e várias comidas no mesmo mundo.
+# Todas as cobras registram o histórico numa única grade espacial (a "broad phase" compartilhada), com a chave
+# (cobra, número sequencial); a posição mais nova de cada uma é a cabeça. As comidas ficam numa grade separada.
+# A cada tick, cada cabeça consulta só as células em volta do caminho que percorreu e resolve, numa única passada,
+# comida, corpo (próprio ou de outra cobra) e cabeça com cabeça. O custo depende de quantos segmentos estão perto
+# das cabeças, e não de (número de cobras x tamanho das cobras).
+
+from settings import HEAD_SIZE, BODY_SIZE, FOOD_SIZE, SWEPT_COLLISION, SNAKE_SPEED, HISTORY_STEP
+from spatial import SpatialGrid
+from telemetry import DEATH_WALL, DEATH_SELF, DEATH_SNAKE, DEATH_HEAD
+
+class Arena:
+    def __init__(self):
+        self.grid = SpatialGrid()
+        self.food_grid = SpatialGrid()
+        self.snakes = []
+        self.foods = []
+        #Os itens da grade são guardados pelo centro, então a busca é ampliada pelo tamanho dos objetos
+        self.body_margin = (max(HEAD_SIZE[0], BODY_SIZE[0]) * 2, max(HEAD_SIZE[1], BODY_SIZE[1]) * 2)
+        self.food_margin = (max(HEAD_SIZE[0], FOOD_SIZE[0]) * 2, max(HEAD_SIZE[1], FOOD_SIZE[1]) * 2)
+        #A cabeça de outra cobra também andou neste tick, e o último ponto do histórico dela pode estar até
+        #HISTORY_STEP px atrás da cabeça, então a busca por obstáculos é ampliada por esses dois deslocamentos
+        reach = (SNAKE_SPEED + HISTORY_STEP) * 2
+        self.obstacle_margin = (self.body_margin[0] + reach, self.body_margin[1] + reach)
+
+    def add_snake(self, snake):
+        """A cobra precisa ter sido criada com grid=arena.grid."""
+        self.snakes.append(snake)
+
+    def add_food(self, food):
+        self.foods.append(food)
+        self.food_grid.insert(food, *food.rect.center)
+
+    def respawn_food(self, food):
+        self.food_grid.remove(food, *food.rect.center)
+        food.respawn()
+        self.food_grid.insert(food, *food.rect.center)
+
+    def sync_foods(self):
+        """Recria a grade das comidas (depois de mudar as posições por fora, como no rewind)."""
+        self.food_grid.clear()
+        for food in self.foods:
+            self.food_grid.insert(food, *food.rect.center)
+
+    def sync_grid(self):
+        """Coloca na grade o histórico das cobras restauradas (GameState.apply) desde o último uso."""
+        for snake in self.snakes:
+            snake.sync_grid()
+
+    def resolve(self):
+        """
+        Colisões de todas as cabeças neste tick (chamar depois de todas as cobras andarem).
+        Retorna (comidas comidas, {cobra: causa da morte}).
+        """
+        self.sync_grid()
+        eaten = []
+        deaths = {}
+        #Posição das cabeças no fim do movimento (antes de alguma ser puxada de volta até o ponto da colisão)
+        heads = {snake: snake.rect.copy() for snake in self.snakes}
+        for snake in self.snakes:
+            #Área percorrida pela cabeça neste tick
+            path = snake.prev_rect.union(snake.rect)
+
+            for food, _ in self.food_grid.query(path.inflate(self.food_margin)):
+                if food not in eaten and snake.head_hit(food.rect, food.mask) is not None:
+                    snake.grow()
+                    eaten.append(food)
+
+            if snake.check_collision_wall():
+                deaths[snake] = DEATH_WALL
+                continue
+
+            #Pega o primeiro obstáculo encontrado pelo caminho da cabeça
+            first_hit = None
+            neck_segments = snake.neck_segments
+            for (owner, stamp), pos in self.grid.query(path.inflate(self.obstacle_margin)):
+                if owner is snake:
+                    index = snake.body_segment_index(stamp)
+                    # Pula os primeiros segmentos (para não colidir com o "pescoço")
+                    if index is None or index < neck_segments:
+                        continue
+                    rect, mask, cause = snake.body_img.get_rect(center=pos), snake.body_mask, DEATH_SELF
+                    motion = (0, 0)
+                elif stamp == owner.history_stamp:
+                    #As duas cabeças andaram no mesmo tick: o teste usa o movimento das duas
+                    rect, mask, cause = heads[owner], owner.head_mask, DEATH_HEAD
+                    motion = (rect.x - owner.prev_rect.x, rect.y - owner.prev_rect.y)
+                else:
+                    if owner.body_segment_index(stamp) is None:
+                        continue
+                    rect, mask, cause = owner.body_img.get_rect(center=pos), owner.body_mask, DEATH_SNAKE
+                    motion = (0, 0)
+
+                t = snake.head_hit(rect, mask, motion)
+                if t is not None and (first_hit is None or t < first_hit[0]):
+                    first_hit = (t, cause)
+
+            if first_hit is not None:
+                t, deaths[snake] = first_hit
+                if SWEPT_COLLISION:
+                    snake._move_head_to(t)
+
+        return eaten, deaths
+
+    def _visible_segments(self, camera):
+        """Segmentos visíveis de todas as cobras com uma única consulta à grade: {cobra: [(número, centro), ...]}."""
+        self.sync_grid()
+        search_rect = camera.rect.inflate(BODY_SIZE[0] * 2, BODY_SIZE[1] * 2)
+        segments = {}
+        for (owner, stamp), pos in self.grid.query(search_rect):
+            index = owner.body_segment_index(stamp)
+            if index is not None:
+                segments.setdefault(owner, []).append((index, pos))
+        #Mesma ordem do desenho completo (do pescoço para a cauda)
+        for visible in segments.values():
+            visible.sort()
+        return segments
+
+    def draw_bodies(self, surface, camera):
+        segments = self._visible_segments(camera)
+        for snake in self.snakes:
+            visible = segments.get(snake)
+            if visible:
+                snake.draw_segments(surface, camera,
+                                    [(index, snake.body_img.get_rect(center=pos)) for index, pos in visible])
+
+    def draw_heads(self, surface, camera):
+        for snake in self.snakes:
+            if camera.is_visible(snake.rect):
+                snake.draw_head(surface, camera)
+
+    def _visible_foods(self, camera):
+        """Comidas que aparecem na câmera, consultando só as células visíveis da grade das comidas."""
+        search_rect = camera.rect.inflate(FOOD_SIZE[0] * 2, FOOD_SIZE[1] * 2)
+        return [food for food, _ in self.food_grid.query(search_rect) if camera.is_visible(food.rect)]
+
+    def draw_foods(self, surface, camera):
+        for food in self._visible_foods(camera):
+            surface.blit(food.draw_image, camera.apply(food.rect))
+
+    def sprites(self, camera):
+        """
+        Tudo o que aparece na câmera como (imagem, posição na tela), na ordem de desenho:
+        comidas, corpos e cabeças (o mesmo resultado de draw_foods + draw_bodies + draw_heads).
+        """
+        sprites = [(food.draw_image, camera.apply(food.rect).topleft) for food in self._visible_foods(camera)]
+
+        to_screen = camera.to_screen
+        segments = self._visible_segments(camera)
+        for snake in self.snakes:
+            for index, pos in segments.get(snake, ()):
+                rect = snake.body_img.get_rect(center=pos)
+                sprites.append((snake.segment_image(index), to_screen(rect.x, rect.y)))
+
+        for snake in self.snakes:
+            if camera.is_visible(snake.rect):
+                sprites.append((snake.head_draw_img, camera.apply(snake.rect).topleft))
+        return sprites
\ No newline at end of file
@@ -0,0 +1,201 @@
+# atlas_packer.py
+# Ferramenta (offline) que junta uma pasta de sprites .png em uma única spritesheet + JSON,
+# no mesmo formato que a classe Spritesheet lê: {"frames": {"nome": {"frame": {"x", "y", "w", "h"}}}}.
+# O empacotamento usa o algoritmo "skyline" (cada sprite vai para a posição mais baixa/à esquerda possível),
+# testando algumas larguras e ficando com a menor área.
+# Se nenhuma sprite e nenhuma opção mudou desde a última vez, nada é refeito.
+#
+# Uso: python atlas_packer.py pasta_das_sprites assets/snake_sprites.png --padding 1 --trim
+
+import os
+import sys
+import json
+import math
+import hashlib
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Empacota uma pasta de sprites em uma spritesheet + JSON")
+    parser.add_argument("input_dir", help="Pasta com as sprites .png (o nome do arquivo vira o nome da sprite)")
+    parser.add_argument("output", help="Caminho do .png gerado (o .json é salvo com o mesmo nome)")
+    parser.add_argument("--padding", type=int, default=1, help="Pixels vazios entre as sprites")
+    parser.add_argument("--trim", action="store_true", help="Remove as bordas transparentes de cada sprite")
+    parser.add_argument("--max-width", type=int, default=2048, help="Largura máxima da spritesheet")
+    parser.add_argument("--force", action="store_true", help="Refaz mesmo se nada mudou")
+    return parser.parse_args()
+
+
+def find_sprites(input_dir):
+    """Lista (nome, caminho) das sprites. Sprites em subpastas ficam com o nome 'pasta/sprite'."""
+    sprites = []
+    for root, _, files in os.walk(input_dir):
+        for filename in files:
+            if filename.lower().endswith('.png'):
+                path = os.path.join(root, filename)
+                name = os.path.splitext(os.path.relpath(path, input_dir))[0].replace(os.sep, '/')
+                sprites.append((name, path))
+    sprites.sort()
+    return sprites
+
+
+def inputs_hash(sprites, args):
+    """Hash do conteúdo de todas as sprites e das opções que mudam o resultado."""
+    digest = hashlib.sha1(f"{args.padding}|{args.trim}|{args.max_width}".encode())
+    for name, path in sprites:
+        digest.update(name.encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def skyline_pack(sizes, width):
+    """
+    Posiciona os retângulos (w, h), na ordem dada, numa faixa de largura fixa.
+    Retorna (posições, altura total) ou None se algum não couber na largura.
+    """
+    #Skyline: lista de segmentos [x, y, largura] com a altura já ocupada em cada trecho
+    skyline = [[0, 0, width]]
+    positions = []
+    height = 0
+    for w, h in sizes:
+        if w > width:
+            return None
+        best = None
+        for i, (x, _, _) in enumerate(skyline):
+            if x + w > width:
+                break
+            #A sprite fica apoiada no segmento mais alto entre os que ela cobre
+            y, covered, j = 0, 0, i
+            while covered < w:
+                y = max(y, skyline[j][1])
+                covered += skyline[j][2]
+                j += 1
+            if best is None or y < best[1]:
+                best = (x, y, i)
+        x, y, i = best
+        positions.append((x, y))
+        height = max(height, y + h)
+
+        #Atualiza o skyline: o novo segmento cobre [x, x + w) na altura y + h
+        new_segments = [[x, y + h, w]]
+        end = x + w
+        for seg_x, seg_y, seg_w in skyline[i:]:
+            seg_end = seg_x + seg_w
+            if seg_end > end:
+                start = max(seg_x, end)
+                new_segments.append([start, seg_y, seg_end - start])
+        skyline = skyline[:i] + new_segments
+        #Junta segmentos vizinhos de mesma altura
+        merged = [skyline[0]]
+        for segment in skyline[1:]:
+            if segment[1] == merged[-1][1]:
+                merged[-1][2] += segment[2]
+            else:
+                merged.append(segment)
+        skyline = merged
+    return positions, height
+
+
+def pack(sizes, max_width):
+    """Testa algumas larguras e retorna (posições, largura, altura) com a menor área."""
+    widest = max(w for w, _ in sizes)
+    area = sum(w * h for w, h in sizes)
+    candidates = {widest, max_width}
+    for factor in (1.0, 1.1, 1.25, 1.5, 2.0):
+        candidates.add(int(math.sqrt(area) * factor))
+    power = 1
+    while power <= max_width:
+        candidates.add(power)
+        power *= 2
+
+    best = None
+    for width in sorted(c for c in candidates if widest <= c <= max_width):
+        result = skyline_pack(sizes, width)
+        if result is None:
+            continue
+        positions, height = result
+        used_width = max(x + w for (x, _), (w, _) in zip(positions, sizes))
+        if best is None or used_width * height < best[1] * best[2]:
+            best = (positions, used_width, height)
+    if best is None:
+        raise ValueError(f"Uma sprite é mais larga que --max-width ({max_width}px)")
+    return best
+
+
+def main():
+    args = parse_args()
+    json_path = args.output.replace('.png', '.json')
+    cache_path = args.output + '.cache'
+
+    sprites = find_sprites(args.input_dir)
+    if not sprites:
+        print(f"Nenhuma sprite .png encontrada em: {args.input_dir}")
+        return 1
+
+    #Empacotamento incremental: compara com o hash salvo na última execução
+    current_hash = inputs_hash(sprites, args)
+    if not args.force and os.path.exists(args.output) and os.path.exists(json_path):
+        try:
+            with open(cache_path) as f:
+                if f.read().strip() == current_hash:
+                    print("Nada mudou, spritesheet já está atualizada.")
+                    return 0
+        except FileNotFoundError:
+            pass
+
+    #Carrega as sprites (e recorta as bordas transparentes, se pedido)
+    images = []
+    for name, path in sprites:
+        image = pygame.image.load(path)
+        area = image.get_bounding_rect() if args.trim else image.get_rect()
+        if area.width == 0 or area.height == 0:
+            area = pygame.Rect(0, 0, 1, 1) # Sprite totalmente transparente
+        images.append((name, image, area))
+
+    #Maiores primeiro (altura, depois largura) deixa o skyline mais regular
+    order = sorted(range(len(images)), key=lambda k: (-images[k][2].height, -images[k][2].width, images[k][0]))
+    padding = args.padding
+    sizes = [(images[k][2].width + padding, images[k][2].height + padding) for k in order]
+    positions, width, height = pack(sizes, args.max_width - padding)
+
+    #Monta a spritesheet. BLEND_RGBA_ADD numa surface zerada copia os pixels exatamente (sem misturar o alpha)
+    atlas = pygame.Surface((width + padding, height + padding), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    frames = {}
+    for k, (x, y) in zip(order, positions):
+        name, image, area = images[k]
+        dest = (x + padding, y + padding)
+        atlas.blit(image, dest, area, special_flags=pygame.BLEND_RGBA_ADD)
+        frames[name] = {"frame": {"x": dest[0], "y": dest[1], "w": area.width, "h": area.height}}
+
+    #Mantém as animações do JSON anterior (elas referenciam as sprites pelo nome)
+    data = {"frames": dict(sorted(frames.items()))}
+    try:
+        with open(json_path) as f:
+            old_data = json.load(f)
+        if 'animations' in old_data:
+            data['animations'] = old_data['animations']
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    pygame.image.save(atlas, args.output)
+    with open(json_path, 'w') as f:
+        json.dump(data, f, indent=4)
+    with open(cache_path, 'w') as f:
+        f.write(current_hash)
+
+    used = sum(image[2].width * image[2].height for image in images)
+    total = atlas.get_width() * atlas.get_height()
+    print(f"{len(images)} sprites -> {args.output} ({atlas.get_width()}x{atlas.get_height()}, "
+          f"{used / total:.0%} ocupado)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,117 @@
+# bench_compositor.py
+# Benchmark da composição em blocos: monta uma arena cheia de cobras (sem janela, driver "dummy" do SDL)
+# e mede o tempo de desenho de um frame no modo normal (uma thread) e com o TileCompositor
+# usando 1, 2, 4, ... threads, até a quantidade de núcleos da máquina.
+#
+# Uso: python bench_compositor.py --snakes 200 --length 300 --width 1920 --height 1080
+
+import os
+import sys
+import argparse
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import settings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark do desenho em blocos (TileCompositor)")
+    parser.add_argument("--snakes", type=int, default=200, help="Cobras do computador na arena")
+    parser.add_argument("--length", type=int, default=300, help="Placar (tamanho) de cada cobra")
+    parser.add_argument("--width", type=int, default=1920, help="Largura da tela (e do mundo)")
+    parser.add_argument("--height", type=int, default=1080, help="Altura da tela (e do mundo)")
+    parser.add_argument("--tiles", default="4x2", help="Blocos no formato COLUNASxLINHAS")
+    parser.add_argument("--warmup-ticks", type=int, default=400, help="Ticks de jogo antes de medir (para as cobras crescerem)")
+    parser.add_argument("--frames", type=int, default=100, help="Frames medidos em cada configuração")
+    parser.add_argument("--workers", default="", help="Lista de threads a testar, ex.: 1,2,4 (padrão: potências de 2 até os núcleos)")
+    return parser.parse_args()
+
+
+def worker_counts(args):
+    if args.workers:
+        return [int(n) for n in args.workers.split(",")]
+    cores = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    counts.append(cores)
+    return counts
+
+
+def measure(draw, frames):
+    """Mediana do tempo (ms) de draw() em 'frames' execuções, depois de algumas de aquecimento."""
+    for _ in range(5):
+        draw()
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    args = parse_args()
+    #O mundo do tamanho da tela deixa todas as cobras visíveis (o pior caso para o desenho)
+    settings.SCREEN_WIDTH = settings.WORLD_WIDTH = args.width
+    settings.SCREEN_HEIGHT = settings.WORLD_HEIGHT = args.height
+    settings.AI_SNAKES = args.snakes
+    settings.FOOD_COUNT = max(1, args.snakes // 4)
+    settings.COMPOSITOR_ENABLED = False
+    #Import depois de ajustar as constantes (os módulos copiam as constantes no import)
+    from main import Game
+    from compositor import TileCompositor
+    from ai import SnakeAI
+
+    random.seed(0)
+    game = Game()
+    for snake in game.snakes:
+        snake.score = args.length
+
+    #Faz as cobras crescerem pela arena. Sem resolver colisões ninguém morre (e ninguém volta para o tamanho zero)
+    pilots = [SnakeAI(game.snake)] + game.ais
+    for _ in range(args.warmup_ticks):
+        for pilot in pilots:
+            pilot.step(game.foods)
+        for snake in game.snakes:
+            snake.update()
+
+    screen, camera, arena = game.screen, game.camera, game.arena
+    camera.follow(game.snake.rect)
+    sprite_count = len(arena.sprites(camera))
+    cols, rows = (int(n) for n in args.tiles.lower().split("x"))
+
+    def draw_serial():
+        screen.fill(settings.COLOR_BLACK)
+        arena.draw_foods(screen, camera)
+        arena.draw_bodies(screen, camera)
+        arena.draw_heads(screen, camera)
+
+    print(f"{args.width}x{args.height}, {len(game.snakes)} cobras, {sprite_count} sprites na tela, "
+          f"blocos {cols}x{rows}, {os.cpu_count()} núcleos")
+    serial_ms = measure(draw_serial, args.frames)
+    #Parte que continua numa thread só com o compositor (limita o ganho com mais núcleos)
+    collect_ms = measure(lambda: arena.sprites(camera), args.frames)
+    print(f"Coleta das sprites visíveis (sempre numa thread): {collect_ms:.2f}ms")
+    print(f"{'modo':>14} | {'ms/frame':>9} | {'speedup':>7}")
+    print(f"{'normal':>14} | {serial_ms:9.2f} | {1.0:6.2f}x")
+
+    for workers in worker_counts(args):
+        compositor = TileCompositor(screen, (cols, rows), workers)
+        ms = measure(lambda: compositor.compose(arena.sprites(camera)), args.frames)
+        compositor.close()
+        print(f"{f'{workers} thread(s)':>14} | {ms:9.2f} | {serial_ms / ms:6.2f}x")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
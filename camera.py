@@ -0,0 +1,37 @@
+# camera.py
+# Câmera que segue a cabeça da cobra. O mundo pode ser bem maior que a janela; a câmera define
+# qual parte do mundo aparece na tela (o viewport) e converte coordenadas do mundo para a tela
+# (já na resolução interna de desenho, ver RENDER_SCALE).
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, RENDER_SCALE
+
+def to_render_size(size):
+    """Tamanho (em pixels do mundo) convertido para a resolução interna de desenho."""
+    return (max(1, round(size[0] * RENDER_SCALE)), max(1, round(size[1] * RENDER_SCALE)))
+
+class Camera:
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        #Rect do viewport em coordenadas do mundo
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.world_rect = pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
+        self.scale = RENDER_SCALE
+
+    def follow(self, target_rect):
+        """Centraliza a câmera no alvo, sem mostrar nada fora do mundo."""
+        self.rect.center = target_rect.center
+        self.rect.clamp_ip(self.world_rect)
+
+    def apply(self, rect):
+        """Converte um rect do mundo para a posição na tela."""
+        if self.scale == 1:
+            return rect.move(-self.rect.x, -self.rect.y)
+        return pygame.Rect(self.to_screen(rect.x, rect.y), to_render_size(rect.size))
+
+    def to_screen(self, x, y):
+        """Converte um ponto do mundo para a tela."""
+        return (round((x - self.rect.x) * self.scale), round((y - self.rect.y) * self.scale))
+
+    def is_visible(self, rect):
+        return self.rect.colliderect(rect)
\ No newline at end of file
@@ -0,0 +1,150 @@
+# capture.py
+# Classe responsável por gravar os frames do jogo sem travar o loop principal.
+# O loop só copia o buffer da tela (uma cópia de memória); a codificação (PNG, arquivo raw ou encoder externo)
+# acontece numa thread separada, alimentada por uma fila limitada.
+
+import pygame
+import os
+import queue
+import shlex
+import subprocess
+import threading
+import time
+
+from settings import (FPS, CAPTURE_MODE, CAPTURE_DIR, CAPTURE_QUEUE_SIZE,
+                      CAPTURE_DROP_FRAMES, CAPTURE_ENCODER_CMD)
+
+# Ordem dos bytes (little endian) -> nome do formato de pixel usado pelo ffmpeg
+_PIX_FMTS = {
+    (0xff0000, 0xff00, 0xff): 'bgr0',
+    (0xff, 0xff00, 0xff0000): 'rgb0',
+    (0xff00, 0xff0000, 0xff000000): '0bgr',
+    (0xff000000, 0xff0000, 0xff00): '0rgb',
+}
+
+class FrameCapture:
+    def __init__(self, surface, mode=CAPTURE_MODE, out_dir=CAPTURE_DIR,
+                 queue_size=CAPTURE_QUEUE_SIZE, drop_frames=CAPTURE_DROP_FRAMES):
+        self.mode = mode
+        #Cada sessão grava numa pasta própria, para não sobrescrever as capturas anteriores
+        self.session = time.strftime("%Y%m%d_%H%M%S")
+        self.out_dir = os.path.join(out_dir, self.session)
+        self.drop_frames = drop_frames
+        self.size = surface.get_size()
+
+        #Se o buffer da tela for 32 bits e sem padding no fim das linhas, os bytes podem ser copiados direto (sem conversão)
+        self.masks = surface.get_masks()[:3]
+        self.direct = (surface.get_bytesize() == 4 and
+                       surface.get_pitch() == self.size[0] * 4 and
+                       self.masks in _PIX_FMTS)
+        self.pix_fmt = _PIX_FMTS[self.masks] if self.direct else 'rgb24'
+
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.dropped_frames = 0
+        self._lost_frames = 0 # Frames perdidos pela thread de escrita (contador separado, só ela escreve nele)
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._raw_file = None
+        self._encoder = None
+        self._broken = False # A gravação falhou (disco, pasta apagada, encoder encerrado...)
+        self._open_output()
+
+        self._thread = threading.Thread(target=self._writer_loop, name="FrameCapture", daemon=True)
+        self._thread.start()
+
+    def _open_output(self):
+        """Cria a pasta da sessão e abre a saída. Levanta OSError se não der (ex.: encoder não instalado)."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        w, h = self.size
+
+        if self.mode == 'raw':
+            self._raw_file = open(os.path.join(self.out_dir, 'capture.raw'), 'wb')
+            #Arquivo com as informacoes necessarias para ler o .raw depois
+            with open(os.path.join(self.out_dir, 'capture.txt'), 'w') as f:
+                f.write(f"width={w}\nheight={h}\nfps={FPS}\npix_fmt={self.pix_fmt}\n")
+
+        elif self.mode == 'pipe':
+            cmd = CAPTURE_ENCODER_CMD.format(w=w, h=h, fps=FPS, pix_fmt=self.pix_fmt,
+                                             out=shlex.quote(os.path.join(self.out_dir, 'capture.mp4')))
+            self._encoder = subprocess.Popen(shlex.split(cmd), stdin=subprocess.PIPE)
+
+        elif self.mode != 'png':
+            raise ValueError(f"Modo de captura desconhecido: {self.mode}")
+
+    def grab(self, surface):
+        """Copia o frame atual para a fila (chamado pelo loop principal, antes do flip)."""
+        if self.direct:
+            #get_buffer expõe a memória da tela; .raw faz uma única cópia dos bytes
+            buffer = surface.get_buffer()
+            data = buffer.raw
+            del buffer # Libera o lock da surface
+        else:
+            data = pygame.image.tobytes(surface, 'RGB')
+
+        self.frames_captured += 1
+        try:
+            self._queue.put_nowait((self.frames_captured, data))
+        except queue.Full:
+            if self.drop_frames:
+                self.dropped_frames += 1
+            else:
+                #Backpressure: o jogo espera a thread de escrita liberar espaço
+                self._queue.put((self.frames_captured, data))
+
+    def _writer_loop(self):
+        #Surface reaproveitada para salvar os PNGs, no mesmo formato de pixel da tela
+        if self.direct:
+            frame_surface = pygame.Surface(self.size, 0, 32, self.masks + (0,))
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            #Se a gravação falhar, continua consumindo a fila para o jogo nunca ficar travado esperando espaço
+            if self._broken:
+                self._lost_frames += 1
+                continue
+            index, data = item
+
+            try:
+                if self.mode == 'png':
+                    if self.direct:
+                        frame_surface.get_buffer().write(data)
+                        image = frame_surface
+                    else:
+                        image = pygame.image.frombytes(data, self.size, 'RGB')
+                    pygame.image.save(image, os.path.join(self.out_dir, f"frame_{index:06d}.png"))
+                elif self.mode == 'raw':
+                    self._raw_file.write(data)
+                else:
+                    self._encoder.stdin.write(data)
+            except (pygame.error, OSError) as e: # BrokenPipeError (encoder encerrado) também é OSError
+                print(f"Erro: A gravação da captura falhou: {e}")
+                self._broken = True
+                self._lost_frames += 1
+                continue
+
+            self.frames_written += 1
+
+    def stop(self):
+        """Espera a fila esvaziar, fecha os arquivos e informa quantos frames foram perdidos."""
+        self._queue.put(None)
+        self._thread.join()
+
+        if self._raw_file is not None:
+            try:
+                self._raw_file.close()
+            except OSError:
+                pass
+        if self._encoder is not None:
+            try:
+                self._encoder.stdin.close()
+            except OSError:
+                pass
+            self._encoder.wait()
+
+        self.dropped_frames += self._lost_frames
+        print(f"Captura finalizada: {self.frames_written} frames gravados, "
+              f"{self.dropped_frames} descartados ({self.out_dir})")
+        return self.dropped_frames
\ No newline at end of file
@@ -0,0 +1,75 @@
+# compositor.py
+# Desenha o frame em paralelo: a tela é dividida em blocos (subsurfaces, que dividem os pixels com a tela),
+# cada sprite é colocada na lista de todo bloco que o seu rect encosta, e cada bloco é limpo e desenhado
+# por uma thread. O pygame solta o GIL durante fill e blits, então os blocos são desenhados em núcleos diferentes.
+# Depois que todos terminam, o frame é apresentado uma única vez (pelo loop principal, como antes).
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from settings import COLOR_BLACK, COMPOSITOR_TILES, COMPOSITOR_WORKERS
+
+class TileCompositor:
+    def __init__(self, surface, tiles=COMPOSITOR_TILES, workers=COMPOSITOR_WORKERS):
+        width, height = surface.get_size()
+        cols, rows = max(1, min(tiles[0], width)), max(1, min(tiles[1], height))
+        self.tile_width = -(-width // cols)
+        self.tile_height = -(-height // rows)
+        #Com o arredondamento para cima, o último bloco poderia ficar vazio
+        self.cols = -(-width // self.tile_width)
+        self.rows = -(-height // self.tile_height)
+
+        #(subsurface, x, y) de cada bloco, linha por linha
+        self.tiles = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                rect = pygame.Rect(col * self.tile_width, row * self.tile_height,
+                                   self.tile_width, self.tile_height).clip(surface.get_rect())
+                self.tiles.append((surface.subsurface(rect), rect.x, rect.y))
+        #Listas de sprites de cada bloco (reaproveitadas a cada frame)
+        self.batches = [[] for _ in self.tiles]
+
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="Compositor")
+
+    def compose(self, sprites, background=COLOR_BLACK):
+        """Limpa a tela e desenha as sprites (imagem, (x, y)), na ordem dada, usando as threads."""
+        batches = self.batches
+        for batch in batches:
+            batch.clear()
+
+        tile_width, tile_height = self.tile_width, self.tile_height
+        last_col, last_row = self.cols - 1, self.rows - 1
+        cols, tiles = self.cols, self.tiles
+        for image, (x, y) in sprites:
+            width, height = image.get_size()
+            first_col, end_col = max(0, x // tile_width), min(last_col, (x + width - 1) // tile_width)
+            first_row, end_row = max(0, y // tile_height), min(last_row, (y + height - 1) // tile_height)
+            if first_col == end_col and first_row == end_row:
+                #Caso mais comum: a sprite cabe inteira num bloco
+                index = first_row * cols + first_col
+                _, tile_x, tile_y = tiles[index]
+                batches[index].append((image, (x - tile_x, y - tile_y)))
+                continue
+            for row in range(first_row, end_row + 1):
+                for col in range(first_col, end_col + 1):
+                    index = row * cols + col
+                    _, tile_x, tile_y = tiles[index]
+                    #Posição relativa ao bloco; o que passar da borda é cortado pela própria subsurface
+                    batches[index].append((image, (x - tile_x, y - tile_y)))
+
+        futures = [self._executor.submit(self._draw_tile, tile, batch, background)
+                   for (tile, _, _), batch in zip(tiles, batches)]
+        for future in futures:
+            future.result() # Espera todos os blocos (e repassa erros das threads)
+
+    @staticmethod
+    def _draw_tile(tile, batch, background):
+        tile.fill(background)
+        if batch:
+            tile.blits(batch, doreturn=False)
+
+    def close(self):
+        self._executor.shutdown()
\ No newline at end of file
@@ -3,7 +3,8 @@
 import pygame
 import random
 
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FOOD_SIZE
+from settings import WORLD_WIDTH, WORLD_HEIGHT, FOOD_SIZE, RENDER_SCALE
+from camera import to_render_size
 
 #Para iniciar a comida é necessário passar a textura da comida
 class Food:
@@ -11,6 +12,10 @@ class Food:
 
         self.image = pygame.transform.scale(image, FOOD_SIZE)
         self.rect = self.image.get_rect()
+        #Máscara de pixels para a colisão precisa (calculada uma única vez)
+        self.mask = pygame.mask.from_surface(self.image)
+        #Imagem usada no desenho, na resolução interna (a de cima continua sendo usada na colisão)
+        self.draw_image = self.image if RENDER_SCALE == 1 else pygame.transform.scale(image, to_render_size(FOOD_SIZE))
         
         self.respawn()
 
@@ -20,11 +25,14 @@ class Food:
         margin_x = 30
         margin_y = 60 # Margem maior no topo para o placar
         
-        rand_x = random.randint(margin_x, SCREEN_WIDTH - margin_x)
-        rand_y = random.randint(margin_y, SCREEN_HEIGHT - margin_x)
+        rand_x = random.randint(margin_x, WORLD_WIDTH - margin_x)
+        rand_y = random.randint(margin_y, WORLD_HEIGHT - margin_x)
         self.rect.center = (rand_x, rand_y)
 
     #Desenha a comida na tela
-    def draw(self, surface):  
-                     
-        surface.blit(self.image, self.rect)
\ No newline at end of file
+    def draw(self, surface, camera=None):  
+        if camera is None:
+            surface.blit(self.image, self.rect)
+        #Fora da área visível não precisa desenhar
+        elif camera.is_visible(self.rect):
+            surface.blit(self.draw_image, camera.apply(self.rect))
\ No newline at end of file
@@ -165,41 +165,68 @@ except (pygame.error, FileNotFoundError, json.JSONDecodeError, KeyError, TypeErr
 # --- 6. Função Principal do Jogo ---
 def game_loop():
     running = True
-    game_over = False
 
-    # Variáveis da Cobra
-    snake_head_rect = head_original_img.get_rect(
-        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-    )
-    snake_head_img = head_original_img
+    # --- Objetos reaproveitados entre as partidas ---
+    # Antes, reiniciar chamava game_loop() de novo (recursão): cada partida deixava um frame na pilha
+    # com todas as suas variáveis vivas. Agora tudo é criado uma vez e só é resetado ao reiniciar.
+    snake_head_rect = head_original_img.get_rect()
     head_position_history = []
-    
-    # Direção inicial
-    direction_x = SNAKE_SPEED
-    direction_y = 0
-    current_angle = 270 
-
-    # --- MODIFICADO: CONTROLE DE COOLDOWN DE CURVA ---
-    last_turn_position = snake_head_rect.center 
-    last_direction_x = direction_x
-    last_direction_y = direction_y
+    body_rect_list = []
+    food_rect = food_img.get_rect()
     TURN_COOLDOWN_DISTANCE = HEAD_SIZE[0] * HEAD_P
-    
-    # --- NOVO: Variáveis de "Curva Pendente" ---
-    pending_direction_x = None
-    pending_direction_y = None
-    pending_angle = None
-    
-    # Variáveis da Comida
-    food_rect = food_img.get_rect(
-        center=(random.randint(30, SCREEN_WIDTH - 30),
-                random.randint(60, SCREEN_HEIGHT - 30))
+
+    # Cabeça já girada para cada ângulo (evita girar a imagem a cada frame)
+    rotated_heads = {}
+
+    # Tela de Game Over (não muda, então é criada uma única vez)
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 150))
+    game_over_surface = game_over_font.render("VOCÊ PERDEU!", True, COLOR_WHITE)
+    game_over_rect = game_over_surface.get_rect(
+        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
+    )
+    restart_surface = restart_font.render("Pressione [R] para reiniciar", True, COLOR_WHITE)
+    restart_rect = restart_surface.get_rect(
+        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
     )
 
-    # Placar
-    score = 0
+    new_game = True
 
     while running:
+
+        # --- Início / Reinício da partida ---
+        if new_game:
+            new_game = False
+            game_over = False
+
+            # Variáveis da Cobra
+            snake_head_rect.size = head_original_img.get_size()
+            snake_head_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            snake_head_img = head_original_img
+            head_position_history.clear()
+            body_rect_list.clear()
+
+            # Direção inicial
+            direction_x = SNAKE_SPEED
+            direction_y = 0
+            current_angle = 270 
+
+            # --- MODIFICADO: CONTROLE DE COOLDOWN DE CURVA ---
+            last_turn_position = snake_head_rect.center 
+            last_direction_x = direction_x
+            last_direction_y = direction_y
+
+            # --- NOVO: Variáveis de "Curva Pendente" ---
+            pending_direction_x = None
+            pending_direction_y = None
+            pending_angle = None
+
+            # Variáveis da Comida
+            food_rect.center = (random.randint(30, SCREEN_WIDTH - 30),
+                                random.randint(60, SCREEN_HEIGHT - 30))
+
+            # Placar
+            score = 0
         
         # --- 7. Tratamento de Eventos (Input) ---
         for event in pygame.event.get():
@@ -209,7 +236,7 @@ def game_loop():
             if event.type == pygame.KEYDOWN:
                 # LÓGICA PARA REINICIAR
                 if game_over and event.key == pygame.K_r:
-                    game_loop() # Chama a função de novo, reiniciando tudo
+                    new_game = True # Reinicia no começo do próximo frame (sem chamar game_loop de novo)
                 
                 # LÓGICA DE MOVIMENTO
                 if not game_over:
@@ -271,7 +298,10 @@ def game_loop():
 
             # --- 8. Lógica de Atualização do Jogo ---
 
-            snake_head_img = pygame.transform.rotate(head_original_img, current_angle)
+            snake_head_img = rotated_heads.get(current_angle)
+            if snake_head_img is None:
+                snake_head_img = pygame.transform.rotate(head_original_img, current_angle)
+                rotated_heads[current_angle] = snake_head_img
             new_head_rect = snake_head_img.get_rect(center=snake_head_rect.center)
             new_head_rect.move_ip(direction_x, direction_y)
             snake_head_rect = new_head_rect
@@ -305,7 +335,7 @@ def game_loop():
         screen.blit(food_img, food_rect)
 
         # Desenha o Corpo
-        body_rect_list = []
+        body_rect_list.clear()
         for i in range(score):
             history_index = (i + 1) * BODY_SPACING
             
@@ -339,20 +369,7 @@ def game_loop():
 
         # --- 11. DESENHAR TELA DE GAME OVER ---
         if game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
             screen.blit(overlay, (0, 0))
-
-            game_over_surface = game_over_font.render("VOCÊ PERDEU!", True, COLOR_WHITE)
-            game_over_rect = game_over_surface.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
-            )
-            
-            restart_surface = restart_font.render("Pressione [R] para reiniciar", True, COLOR_WHITE)
-            restart_rect = restart_surface.get_rect(
-                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
-            )
-            
             screen.blit(game_over_surface, game_over_rect)
             screen.blit(restart_surface, restart_rect)
 
@@ -2,34 +2,127 @@ import pygame
 import sys
 import os
 import json
+import time
+import random
 
 from settings import *
 from spritesheet import Spritesheet
 from snake import Snake
 from food import Food
+from capture import FrameCapture
+from state import GameState, RewindBuffer
+from camera import Camera, to_render_size
+from animation import load_animations
+from arena import Arena
+from ai import SnakeAI
+from compositor import TileCompositor
+from telemetry import Telemetry, EVENT_GAME_START, EVENT_SCORE, EVENT_DEATH, EVENT_FRAME_TIME
 
 class Game:
     def __init__(self):
-        
-        pygame.init()
-        pygame.font.init()
+        #Marcos de tempo da inicializacao (em ms), usados no relatorio de startup
+        self._startup_start = time.perf_counter()
+        self.startup_times = {}
+
+        if FAST_START:
+            #O jogo só usa vídeo e eventos (o módulo de eventos é iniciado junto com o display), o áudio nem é iniciado
+            pygame.display.init()
+        else:
+            pygame.init()
+            pygame.font.init()
         
         #Criar a tela,onde o jogo sera executado, do tamnho definido
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        #self.screen é onde tudo é desenhado; com RENDER_SCALE < 1 ela é menor que a janela (self.display)
+        render_size = to_render_size((SCREEN_WIDTH, SCREEN_HEIGHT))
+        scale_mode = RENDER_SCALE_MODE
+        if scale_mode == 'scaled' and abs(1 / RENDER_SCALE - round(1 / RENDER_SCALE)) > 1e-9:
+            print("Aviso: RENDER_SCALE_MODE 'scaled' precisa de 1 / RENDER_SCALE inteiro, usando 'transform'")
+            scale_mode = 'transform'
+        if RENDER_SCALE == 1:
+            self.display = self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        elif scale_mode == 'scaled':
+            #O SDL amplia a surface pequena até o tamanho da janela
+            self.display = self.screen = pygame.display.set_mode(render_size, pygame.SCALED)
+        else:
+            self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.screen = pygame.Surface(render_size).convert()
         pygame.display.set_caption("Snake - Isaac")
         self.clock = pygame.time.Clock()
+        self.camera = Camera()
+        self._mark_startup("display")
+
+        #Fontes e a tela de game over são criadas apenas quando forem usadas
+        self.score_font = None
+        self.game_over_assets = None
 
         #Carregar as texturas, caso as texturas nao sejam carregadas elas serão subistituidas por cores sólidas, que estão definidas no arquivo settings.py
         self._load_assets()
-        self._create_fonts()
+        self._mark_startup("assets")
+        if not FAST_START:
+            self._create_fonts()
+            self._create_game_over_assets()
         
         self.game_state = "playing"
+        #Todas as cobras e comidas ficam na arena; self.snake (o jogador) e self.food são as primeiras
+        self.arena = Arena()
+        self.snakes = self.arena.snakes
+        self.foods = self.arena.foods
+        self.ais = []
+        #Jogadores locais: (cobra, {tecla do jogador: seta equivalente})
+        self.players = []
+        #Cobras que renascem sozinhas quando morrem (computador e jogadores além do primeiro)
+        self.respawning = []
+        self.snake = None
+        self.food = None
+
+        #Guarda os últimos segundos de jogo para poder voltar no tempo (tecla Backspace)
+        #(um snapshot a cada REWIND_INTERVAL ticks; None se o rewind estiver desligado)
+        rewind_snapshots = REWIND_SECONDS * FPS // REWIND_INTERVAL
+        self.rewind_buffer = RewindBuffer(rewind_snapshots) if rewind_snapshots > 0 else None
+
+        #Gravação da sessão (opcional), os frames são salvos por uma thread separada
+        self.capture = None
+        if CAPTURE_ENABLED:
+            try:
+                self.capture = FrameCapture(self.screen)
+            except OSError as e: # Pasta sem permissão, encoder (ffmpeg) não encontrado...
+                print(f"Erro: Não foi possível iniciar a captura, o jogo continua sem gravar: {e}")
+
+        #Telemetria (opcional). Desligada, fica None e cada ponto de coleta é só um "if"
+        self.telemetry = Telemetry() if TELEMETRY_ENABLED else None
+        self.tick = 0
+
+        #Desenho em blocos, em paralelo (opcional)
+        self.compositor = TileCompositor(self.screen) if COMPOSITOR_ENABLED else None
 
         #Cria os objetos do jogo
         self._start_new_game()
+
+        #Mostra o primeiro frame antes de carregar o que não é essencial (o placar aparece no frame seguinte)
+        self._draw()
+        self._mark_startup("first_frame")
+        if FAST_START:
+            self._create_fonts()
+            self._mark_startup("fonts")
+        self._report_startup()
         
+    def _mark_startup(self, name):
+        self.startup_times[name] = (time.perf_counter() - self._startup_start) * 1000
+
+    def _report_startup(self):
+        """Mostra quanto tempo cada etapa da inicializacao levou e se o primeiro frame ficou dentro do orçamento."""
+        steps = ", ".join(f"{name}={ms:.1f}ms" for name, ms in self.startup_times.items())
+        print(f"Startup: {steps}")
+        if not self.first_frame_within_budget():
+            print(f"Aviso: o primeiro frame passou do orçamento de {FIRST_FRAME_BUDGET_MS}ms")
+
+    def first_frame_within_budget(self):
+        return self.startup_times["first_frame"] <= FIRST_FRAME_BUDGET_MS
+
+
     #Loop principal
     def run(self):        
+        frame = 0
         while True:
             # 1. Processar Eventos (Input)
             self._handle_events()
@@ -42,14 +135,26 @@ class Game:
             
             # 4. Controlar FPS
             self.clock.tick(FPS)
+
+            # 5. Amostra do tempo gasto no frame (sem contar a espera do clock)
+            frame += 1
+            if self.telemetry is not None and frame % TELEMETRY_FRAME_SAMPLE == 0:
+                self.telemetry.emit(EVENT_FRAME_TIME, self.clock.get_rawtime())
             
     def _handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self._quit_game()            
-            #Passar a captura de eventos, do loop principal, para o objeto da cobra
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+                if self.rewind_buffer is not None:
+                    self.rewind_buffer.rewind(self, max(1, REWIND_STEP_SECONDS * FPS // REWIND_INTERVAL))
+                continue
+            #Passar a captura de eventos, do loop principal, para a cobra de cada jogador (com as teclas dele)
             if self.game_state == "playing":
-                self.snake.handle_input(event)
+                if event.type == pygame.KEYDOWN:
+                    for snake, keys in self.players:
+                        if event.key in keys:
+                            snake.request_turn(keys[event.key])
                 
             elif self.game_state == "game_over":
                 # Se for game over, procura pela tecla 'R'
@@ -58,6 +163,12 @@ class Game:
 
     def _quit_game(self):
         print("Encerrando o jogo...")
+        if self.capture is not None:
+            self.capture.stop()
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.compositor is not None:
+            self.compositor.close()
         pygame.quit()
         quit()             
 
@@ -73,6 +184,8 @@ class Game:
             self.head_img_original = my_spritesheet.parse_sprite('head')
             self.body_img_original = my_spritesheet.parse_sprite('body')
             self.food_img_original = my_spritesheet.parse_sprite('food')
+            #Frames das animações (já escalados e convertidos para o formato da tela)
+            self.animations = load_animations(my_spritesheet)
             
             print("Sprites carregadas com sucesso! :^}")
 
@@ -86,6 +199,7 @@ class Game:
             self.head_img_original = self._create_fallback_surface(HEAD_SIZE, COLOR_HEAD_FALLBACK)
             self.body_img_original = self._create_fallback_surface(BODY_SIZE, COLOR_BODY_FALLBACK)
             self.food_img_original = self._create_fallback_surface(FOOD_SIZE, COLOR_FOOD_FALLBACK)
+            self.animations = {}
 
     def _create_fallback_surface(self, size, color):
         surface = pygame.Surface(size)
@@ -94,16 +208,84 @@ class Game:
     
     def _create_fonts(self):
         #Carrega fontes do jogo (se der tempo vou adicionar as fontes do Isaac, por enquanto usar fontes padrão do pygame)
-        self.score_font = pygame.font.Font(None, 50)
-        self.game_over_font = pygame.font.Font(None, 75)
-        self.restart_font = pygame.font.Font(None, 40)
+        pygame.font.init()
+        self.score_font = pygame.font.Font(None, round(50 * RENDER_SCALE))
+
+    def _create_game_over_assets(self):
+        #A tela de game over não muda, então o overlay e os textos são criados uma única vez
+        pygame.font.init()
+        game_over_font = pygame.font.Font(None, round(75 * RENDER_SCALE))
+        restart_font = pygame.font.Font(None, round(40 * RENDER_SCALE))
+        width, height = self.screen.get_size()
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150)) # Preto semi-transparente
+
+        go_surf = game_over_font.render("VOCÊ PERDEU!", True, COLOR_WHITE)
+        go_rect = go_surf.get_rect(center=(width // 2, height // 2 - round(40 * RENDER_SCALE)))
+
+        restart_surf = restart_font.render("Pressione [R] para reiniciar", True, COLOR_WHITE)
+        restart_rect = restart_surf.get_rect(center=(width // 2, height // 2 + round(20 * RENDER_SCALE)))
+
+        self.game_over_assets = [(overlay, (0, 0)), (go_surf, go_rect), (restart_surf, restart_rect)]
 
     def _start_new_game(self):
-        #Cria/Reseta os objetos Snake e Food para um novo jogo.
+        #Cria os objetos Snake e Food na primeira partida; nas seguintes eles são resetados (sem escalar as sprites de novo).
         print("Iniciando novo jogo...")
         self.game_state = "playing"
-        self.snake = Snake(self.head_img_original, self.body_img_original)
-        self.food = Food(self.food_img_original)
+        if self.snake is None:
+            if not 1 <= LOCAL_PLAYERS <= len(PLAYER_KEYS):
+                raise ValueError(f"LOCAL_PLAYERS precisa estar entre 1 e {len(PLAYER_KEYS)}")
+            arrows = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+            for i in range(LOCAL_PLAYERS + AI_SNAKES):
+                snake = Snake(self.head_img_original, self.body_img_original, self.animations.get('body'),
+                              grid=self.arena.grid)
+                self.arena.add_snake(snake)
+                if i < LOCAL_PLAYERS:
+                    keys = dict(zip((pygame.key.key_code(name) for name in PLAYER_KEYS[i]), arrows))
+                    self.players.append((snake, keys))
+                else:
+                    self.ais.append(SnakeAI(snake))
+                if i > 0:
+                    self.respawning.append(snake)
+            self.snake = self.snakes[0]
+            self.snake.telemetry = self.telemetry
+            for _ in range(FOOD_COUNT):
+                self.arena.add_food(Food(self.food_img_original))
+            self.food = self.foods[0]
+        else:
+            self.snake.reset()
+            for food in self.foods:
+                self.arena.respawn_food(food)
+        #O jogador 1 começa no centro e as outras cobras em lugares aleatórios
+        for snake in self.respawning:
+            snake.reset(self._random_spawn())
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.clear()
+        if self.telemetry is not None:
+            self.telemetry.emit(EVENT_GAME_START)
+
+    def _random_spawn(self):
+        """Lugar aleatório para uma cobra nascer, de preferência longe das outras."""
+        margin = 100
+        for _ in range(10):
+            pos = (random.randint(margin, max(margin, WORLD_WIDTH - margin)),
+                   random.randint(margin, max(margin, WORLD_HEIGHT - margin)))
+            area = pygame.Rect(0, 0, margin * 2, margin * 2)
+            area.center = pos
+            if next(self.arena.grid.query(area), None) is None:
+                break
+        return pos
+
+    def snapshot(self, state=None):
+        """Retorna uma cópia compacta do estado do jogo. Passe um GameState para reaproveitá-lo."""
+        if state is None:
+            state = GameState()
+        return state.capture(self)
+
+    def restore(self, state):
+        """Volta o jogo para um estado salvo com snapshot()."""
+        state.apply(self)
 
 
 
@@ -113,25 +295,50 @@ class Game:
         if self.game_state != "playing":
             return
             
-        self.snake.update()
+        if self.rewind_buffer is not None and self.tick % REWIND_INTERVAL == 0:
+            self.rewind_buffer.push(self)
+        #Os pilotos consultam a grade, que pode estar atrasada depois de um restore
+        self.arena.sync_grid()
+        for ai in self.ais:
+            ai.step(self.foods)
+        for snake in self.snakes:
+            snake.update()
+        self.tick += 1
         
-        # Verifica colisão da cobra com a comida
-        if self.snake.check_collision_food(self.food.rect):
-            self.food.respawn() # Se comer, a comida muda de lugar
-            
-        # Verifica colisões de fim de jogo
-        if self.snake.check_collision_wall() or self.snake.check_collision_self():
+        # Verifica todas as colisões (comida, paredes, corpos e cabeças) numa única passada
+        eaten, deaths = self.arena.resolve()
+        for food in eaten:
+            self.arena.respawn_food(food) # Se comer, a comida muda de lugar
+
+        # As cobras do computador e os outros jogadores renascem; a morte do jogador 1 é fim de jogo
+        for snake in self.respawning:
+            if snake in deaths:
+                snake.reset(self._random_spawn())
+        death_cause = deaths.get(self.snake)
+
+        if death_cause is not None:
             print("Game Over: Colisão detectada!")
             self.game_state = "game_over"
 
+        if self.telemetry is not None:
+            if self.tick % TELEMETRY_SCORE_SAMPLE == 0:
+                self.telemetry.emit(EVENT_SCORE, self.snake.score)
+            if death_cause is not None:
+                self.telemetry.emit(EVENT_DEATH, death_cause)
+
     def _draw(self):    
-        # 1. Limpa a tela
-        self.screen.fill(COLOR_BLACK)
-        
-        # 2. Desenha os objetos
-        self.food.draw(self.screen)
-        self.snake.draw_body(self.screen)
-        self.snake.draw_head(self.screen) # Cabeça por cima do corpo
+        self.camera.follow(self.snake.rect)
+        if self.compositor is not None:
+            # 1 e 2. Cada bloco da tela é limpo e desenhado por uma thread
+            self.compositor.compose(self.arena.sprites(self.camera))
+        else:
+            # 1. Limpa a tela
+            self.screen.fill(COLOR_BLACK)
+
+            # 2. Desenha os objetos (só o que está dentro da câmera)
+            self.arena.draw_foods(self.screen, self.camera)
+            self.arena.draw_bodies(self.screen, self.camera)
+            self.arena.draw_heads(self.screen, self.camera) # Cabeças por cima dos corpos
         
         # 3. Desenha a UI (Placar)
         self._draw_score()
@@ -140,32 +347,35 @@ class Game:
         if self.game_state == "game_over":
             self._draw_game_over_overlay()
 
-        # 5. Atualiza o display
+        # 5. Captura o frame (apenas copia o buffer, a gravação é feita em outra thread)
+        if self.capture is not None:
+            self.capture.grab(self.screen)
+
+        # 6. Amplia a resolução interna para a janela (uma única vez por frame) e atualiza o display
+        if self.screen is not self.display:
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
         pygame.display.flip()
 
     def _draw_score(self):
         """Desenha o placar no topo da tela."""
-        score_text = f"Placar: {self.snake.score}"
+        if self.score_font is None:
+            return
+        if len(self.players) == 1:
+            score_text = f"Placar: {self.snake.score}"
+        else:
+            score_text = "   ".join(f"J{i + 1}: {snake.score}" for i, (snake, _) in enumerate(self.players))
         score_surf = self.score_font.render(score_text, True, COLOR_WHITE)
-        score_rect = score_surf.get_rect(center=(SCREEN_WIDTH // 2, 30))
+        score_rect = score_surf.get_rect(center=(self.screen.get_width() // 2, round(30 * RENDER_SCALE)))
         self.screen.blit(score_surf, score_rect)
 
     def _draw_game_over_overlay(self):
         """Desenha a tela de "VOCÊ PERDEU"."""
-        # Overlay escuro
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150)) # Preto semi-transparente
-        self.screen.blit(overlay, (0, 0))
-        
-        # Textos
-        go_surf = self.game_over_font.render("VOCÊ PERDEU!", True, COLOR_WHITE)
-        go_rect = go_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-        
-        restart_surf = self.restart_font.render("Pressione [R] para reiniciar", True, COLOR_WHITE)
-        restart_rect = restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        
-        self.screen.blit(go_surf, go_rect)
-        self.screen.blit(restart_surf, restart_rect)
+        if self.game_over_assets is None:
+            self._create_game_over_assets()
+
+        # Overlay escuro e textos
+        for surf, pos in self.game_over_assets:
+            self.screen.blit(surf, pos)
 
 
 
@@ -13,7 +13,10 @@ SNAKE_SPEED = 8
 HEAD_SIZE = (35, 35)
 BODY_SIZE = (27, 22)
 HEAD_P = 0.75 # Percentual da cabeça para cooldown de curva
-BODY_SPACING = 5 # Espaçamento entre os segmentos do corpo
+BODY_SPACING = 5 # Espaçamento entre os segmentos do corpo (em pontos do histórico)
+# Distância (px) entre os pontos do histórico, medida ao longo do caminho da cabeça. Assim os segmentos ficam
+# sempre a BODY_SPACING * HISTORY_STEP px um do outro, mesmo com SNAKE_SPEED alto (vários pontos por tick)
+HISTORY_STEP = 8
 
 # --- 3. Configurações da Comida ---
 FOOD_SIZE = (18, 19)
@@ -34,4 +37,86 @@ except NameError:
     SCRIPT_DIR = os.getcwd() 
 
 ASSET_PATH = os.path.join(SCRIPT_DIR, 'assets') 
-SPRITESHEET_FILENAME = 'snake_sprites.png'
\ No newline at end of file
+SPRITESHEET_FILENAME = 'snake_sprites.png'
+
+# --- 6. Captura de Frames (Gravação de sessões) ---
+CAPTURE_ENABLED = False
+CAPTURE_MODE = 'png' # 'png' (sequência de imagens), 'raw' (arquivo único) ou 'pipe' (encoder local)
+CAPTURE_DIR = os.path.join(SCRIPT_DIR, 'captures') # Cada sessão grava numa subpasta com a data e hora do início
+CAPTURE_QUEUE_SIZE = 64 # Máximo de frames aguardando a thread de escrita
+CAPTURE_DROP_FRAMES = True # True: descarta frames se a fila encher | False: o jogo espera (backpressure)
+# Comando do encoder para o modo 'pipe'. Os campos {w}, {h}, {fps}, {pix_fmt} e {out} são preenchidos na hora.
+CAPTURE_ENCODER_CMD = ('ffmpeg -loglevel error -y -f rawvideo -pix_fmt {pix_fmt} -s {w}x{h} -r {fps} '
+                       '-i - -c:v libx264 -preset ultrafast -pix_fmt yuv420p {out}')
+
+
+# --- 7. Inicialização ---
+FAST_START = True # Inicia só o display/eventos e carrega fontes e tela de game over sob demanda
+FIRST_FRAME_BUDGET_MS = 250 # Tempo máximo esperado até o primeiro frame aparecer
+
+
+# --- 8. Rewind ---
+REWIND_SECONDS = 5 # Quantos segundos de jogo ficam guardados para voltar no tempo (0 = sem rewind)
+REWIND_STEP_SECONDS = 1 # Quanto o jogo volta a cada vez que o Backspace é pressionado
+# Cada snapshot copia o histórico de todas as cobras (custo proporcional ao tamanho somado delas).
+# Em arenas grandes, guardar um snapshot a cada N ticks divide esse custo por N (o rewind fica menos preciso).
+REWIND_INTERVAL = 1
+
+
+# --- 9. Mundo e Câmera ---
+# Tamanho da arena. Se for maior que a tela, a câmera segue a cabeça da cobra.
+WORLD_WIDTH = SCREEN_WIDTH
+WORLD_HEIGHT = SCREEN_HEIGHT
+SPATIAL_CELL_SIZE = 64 # Tamanho (px) das células da grade espacial usada para desenhar só o que está visível
+
+
+# --- 10. Colisão ---
+PIXEL_COLLISION = True # Usa as máscaras de pixels das sprites (ignora os cantos transparentes) depois do teste de rects
+# Colisão contínua: testa todo o caminho percorrido pela cabeça no frame, e não só a posição final.
+# Permite aumentar SNAKE_SPEED (e baixar o FPS) sem a cabeça atravessar a comida ou o corpo.
+SWEPT_COLLISION = True
+
+
+# --- 11. Telemetria ---
+TELEMETRY_ENABLED = False
+TELEMETRY_DIR = os.path.join(SCRIPT_DIR, 'telemetry')
+TELEMETRY_FORMAT = 'jsonl' # 'jsonl' ou 'csv'
+TELEMETRY_BUFFER_SIZE = 4096 # Eventos que cabem no anel até a thread gravar
+TELEMETRY_FLUSH_INTERVAL = 1.0 # Segundos entre cada gravação em disco
+TELEMETRY_MAX_FILE_BYTES = 5 * 1024 * 1024 # Tamanho máximo de cada arquivo antes de abrir o próximo
+TELEMETRY_SCORE_SAMPLE = FPS # A cada quantos ticks o placar é registrado
+TELEMETRY_FRAME_SAMPLE = 10 # A cada quantos frames o tempo de frame é registrado
+
+
+# --- 12. Resolução Interna ---
+# O frame é desenhado numa surface menor (RENDER_SCALE x tela) e ampliado uma vez por frame.
+# Em máquinas fracas, troca resolução por FPS. 1.0 = desenha direto na tela, sem ampliar.
+RENDER_SCALE = 1.0
+# 'transform': a janela tem sempre SCREEN_WIDTH x SCREEN_HEIGHT e o frame é ampliado com transform.scale.
+# 'scaled': ampliação feita pelo SDL (pygame.SCALED). O SDL escolhe o tamanho da janela (o maior múltiplo inteiro
+# da resolução interna que cabe no monitor), então só é usado quando 1 / RENDER_SCALE é inteiro (0.5, 0.25...);
+# nos outros casos o jogo volta para 'transform'.
+RENDER_SCALE_MODE = 'transform'
+
+
+# --- 13. Várias Cobras ---
+AI_SNAKES = 0 # Cobras controladas pelo computador, além dos jogadores (0 = jogo clássico)
+FOOD_COUNT = 1 # Comidas espalhadas pelo mundo ao mesmo tempo
+# Jogadores no mesmo teclado. A câmera e o placar seguem o jogador 1 e a partida termina quando ele morre;
+# os outros jogadores renascem (como as cobras do computador).
+LOCAL_PLAYERS = 1
+# Teclas de cada jogador (cima, baixo, esquerda, direita), com os nomes usados por pygame.key.key_code
+PLAYER_KEYS = (
+    ('up', 'down', 'left', 'right'),
+    ('w', 's', 'a', 'd'),
+    ('i', 'k', 'j', 'l'),
+    ('[8]', '[5]', '[4]', '[6]'),
+)
+
+
+# --- 14. Composição em Blocos ---
+# Divide o frame em blocos (tiles) e desenha cada um numa thread (o pygame solta o GIL durante blits e fills).
+# Vale a pena em arenas grandes, com muitas cobras na tela e vários núcleos.
+COMPOSITOR_ENABLED = False
+COMPOSITOR_TILES = (4, 2) # Colunas x linhas
+COMPOSITOR_WORKERS = 0 # Threads de desenho (0 = uma por núcleo)
\ No newline at end of file
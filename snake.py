@@ -1,32 +1,83 @@
 # snake.py
 # Classe que representa a Cobra lá ele
 
+import math
+
 import pygame
 from settings import *
+from spatial import SpatialGrid
+from telemetry import EVENT_TURN, EVENT_U_TURN_REJECTED
+from camera import to_render_size
 
 class Snake:
     #Para iniciar a cobra é necessário passar a textura da cabeca e do corpo
-    def __init__(self, head_img, body_img):
+    def __init__(self, head_img, body_img, body_animation=None, grid=None):
         #Deixar a textura no tamanho da cabeca, que esta definido no arquivo settings.py
         #original_head_img será usada para fazer a rotacão da cabeca pois, ao rotacionar uma surface ,já rotacionada, a qualidade da imagem diminui.
         self.original_head_img = pygame.transform.scale(head_img, HEAD_SIZE)
         self.body_img = pygame.transform.scale(body_img, BODY_SIZE)
-        self.head_img = self.original_head_img
+        #Animação do corpo (opcional). Os frames já vêm escalados, então desenhar é só escolher o frame
+        self.body_animation = body_animation
+        #Cabeças já giradas, por (flip, ângulo). São poucas combinações, então cada uma é gerada só uma vez
+        #(junto com a máscara de pixels usada na colisão precisa)
+        self.head_imgs = {}
+        self.head_masks = {}
+        self.body_mask = pygame.mask.from_surface(self.body_img)
+
+        #Imagens usadas só no desenho, na resolução interna (RENDER_SCALE). As de cima continuam sendo usadas na colisão
+        if RENDER_SCALE == 1:
+            self.original_head_draw_img = self.original_head_img
+            self.body_draw_img = self.body_img
+        else:
+            self.original_head_draw_img = pygame.transform.scale(head_img, to_render_size(HEAD_SIZE))
+            self.body_draw_img = pygame.transform.scale(body_img, to_render_size(BODY_SIZE))
+        self.head_draw_imgs = {}
+        #Rects do corpo, montados só quando alguém pede (ver body_rects)
+        self._body_rects = []
+        self._body_rects_valid = False
 
-        self.rect = self.head_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        #Cada posição do histórico é registrada uma única vez na grade espacial, com a chave (cobra, número sequencial),
+        #assim dá para achar os segmentos visíveis sem percorrer a cobra inteira.
+        #Com várias cobras a grade é a mesma para todas (ver Arena)
+        self.history_grid = grid if grid is not None else SpatialGrid()
         self.position_history = []
-        self.body_rects = []
+        self.history_stamp = 0
+        #Quando o histórico é trocado por fora (restore), a grade só é atualizada quando for usada de novo.
+        #Enquanto isso, aqui fica (histórico, número) do que ainda está na grade
+        self._grid_history = None
         
         #Vetores de direcão. No pygame o eixo Y é ao contrário e o 0° é no lugar do 90°, (0=Cima, 90=Esquerda, 180=Baixo, 270=Direita)
         self.DIR_RIGHT = pygame.math.Vector2(SNAKE_SPEED, 0)
         self.DIR_LEFT = pygame.math.Vector2(-SNAKE_SPEED, 0)
         self.DIR_UP = pygame.math.Vector2(0, -SNAKE_SPEED)
         self.DIR_DOWN = pygame.math.Vector2(0, SNAKE_SPEED)
+
+        self.turn_cooldown_distance = HEAD_SIZE[0] * HEAD_P
+
+        #Telemetria (definida pelo Game). None = desligada
+        self.telemetry = None
+
+        self.reset()
+
+    def reset(self, start_pos=None):
+        """Volta a cobra para o estado inicial, reaproveitando as imagens já escaladas, as listas e a grade."""
+        #Início da cobra (virada para a direita, no centro do mundo se start_pos não for passado)
+        if start_pos is None:
+            start_pos = (WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+        self.flip = (False, False)
+        self.angle = 0
+        self._update_head_img()
+        self.rect = self.head_img.get_rect(center=start_pos)
+        self.prev_rect = self.rect.copy()
+        self._remove_history_from_grid()
+        self.position_history.clear()
+        self._body_rects_valid = False
+        self.history_stamp = 0
+        #Distância já percorrida desde o último ponto do histórico
+        self.path_carry = 0.0
+        self.anim_tick = 0
         
-        #Início da cobra
         self.direction = self.DIR_RIGHT
-        self.angle = 0
-        self.flip = (False, False)
         
         #---------------------------------------------------------------------------------------------------------------
         #Ao fazer uma curva muito fechada a cabeca da cobra bate no corpo, por esse motivo
@@ -37,7 +88,6 @@ class Snake:
         self.pending_flip = (False, False)
         self.last_turn_position = self.rect.center
         self.last_direction = self.direction.copy()
-        self.turn_cooldown_distance = HEAD_SIZE[0] * HEAD_P
         #---------------------------------------------------------------------------------------------------------------
        
         self.score = 0
@@ -46,26 +96,29 @@ class Snake:
     def handle_input(self, event):        
         if event.type != pygame.KEYDOWN:
             return
-           
+        self.request_turn(event.key)
+
+    def request_turn(self, key):
+        """Registra a intenção de virar (usado pelo teclado e pelos pilotos automáticos)."""
         #Não permite registrar uma nova intencão se já houver uma
         if self.pending_direction is None:
             #Bloquear inversão da direcão exemplo: cobra andando para baixo e aperto para cima ou cobra indo para direita e aperto para esquerda)
-            if event.key == pygame.K_UP and self.direction != self.DIR_DOWN:
+            if key == pygame.K_UP and self.direction != self.DIR_DOWN:
                 self.pending_direction = self.DIR_UP
                 self.pending_angle = 0
                 self.pending_flip = (False, False)
             
-            elif event.key == pygame.K_DOWN and self.direction != self.DIR_UP:
+            elif key == pygame.K_DOWN and self.direction != self.DIR_UP:
                 self.pending_direction = self.DIR_DOWN
                 self.pending_angle = 180
                 self.pending_flip = (False, False)
             
-            elif event.key == pygame.K_LEFT and self.direction != self.DIR_RIGHT:
+            elif key == pygame.K_LEFT and self.direction != self.DIR_RIGHT:
                 self.pending_direction = self.DIR_LEFT
                 self.pending_angle = 0
                 self.pending_flip = (True, False)
             
-            elif event.key == pygame.K_RIGHT and self.direction != self.DIR_LEFT:
+            elif key == pygame.K_RIGHT and self.direction != self.DIR_LEFT:
                 self.pending_direction = self.DIR_RIGHT
                 self.pending_angle = 0
                 self.pending_flip = (False, False)
@@ -101,6 +154,10 @@ class Snake:
             self.angle = self.pending_angle
             self.flip = self.pending_flip
             self.last_turn_position = self.rect.center
+            if self.telemetry is not None:
+                self.telemetry.emit(EVENT_TURN)
+        elif self.telemetry is not None:
+            self.telemetry.emit(EVENT_U_TURN_REJECTED)
         
         #Limpar o comando de virar mesmo que ele não tenha sido executado
         self.pending_direction = None
@@ -110,27 +167,79 @@ class Snake:
     def update(self):
 
         self._apply_turn()
+        self.anim_tick += 1
 
         # 2. Rotaciona a cabeça e move
-        self.head_img = pygame.transform.flip(self.original_head_img, *self.flip)
-        self.head_img = pygame.transform.rotate(self.head_img, self.angle)
+        self._update_head_img()
         
         new_head_rect = self.head_img.get_rect(center=self.rect.center)
+        #Posição antes do movimento, usada na colisão contínua (swept)
+        self.prev_rect = new_head_rect.copy()
         new_head_rect.move_ip(self.direction)
         self.rect = new_head_rect
 
-        # 3. Adiciona a posição central ao histórico
-        self.position_history.insert(0, self.rect.center)
+        # 3. Adiciona ao histórico um ponto a cada HISTORY_STEP px do caminho (com velocidade alta, vários por tick)
+        self._record_path(self.prev_rect.center, self.rect.center)
+
+        # 4. Os rects do corpo mudaram; eles só são recriados se forem usados (a Arena usa a grade)
+        self._body_rects_valid = False
+
+    def _record_path(self, start, end):
+        """Coloca no histórico os pontos do trecho start -> end, a cada HISTORY_STEP px desde o último ponto."""
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        if length == 0:
+            return
+        travelled = HISTORY_STEP - self.path_carry
+        while travelled <= length:
+            f = travelled / length
+            self._push_history((round(start[0] + (end[0] - start[0]) * f),
+                                round(start[1] + (end[1] - start[1]) * f)))
+            travelled += HISTORY_STEP
+        self.path_carry = length - (travelled - HISTORY_STEP)
+
+    def _push_history(self, pos):
+        #(depois de um restore a grade só é refeita em sync_grid, então enquanto isso ela não é mexida)
+        grid_synced = self._grid_history is None
+        self.position_history.insert(0, pos)
+        self.history_stamp += 1
+        if grid_synced:
+            self.history_grid.insert((self, self.history_stamp), *pos, pos)
 
-        # 4. Limita o tamanho do histórico com base no placar
+        #Limita o tamanho do histórico com base no placar
         max_history_len = (self.score + 2) * BODY_SPACING
-        if len(self.position_history) > max_history_len:
-            self.position_history.pop()
-            
-        # 5. (IMPORTANTE) Atualiza a lista de rects do corpo para colisões
-        self._update_body_rects()
-        
+        while len(self.position_history) > max_history_len:
+            oldest_stamp = self.history_stamp - len(self.position_history) + 1
+            oldest_pos = self.position_history.pop()
+            if grid_synced:
+                self.history_grid.remove((self, oldest_stamp), *oldest_pos)
+
 
+    def _update_head_img(self):
+        """Gera a imagem da cabeça a partir da original, conforme o flip e o ângulo atuais."""
+        key = (self.flip, self.angle)
+        head_img = self.head_imgs.get(key)
+        if head_img is None:
+            head_img = pygame.transform.flip(self.original_head_img, *self.flip)
+            head_img = pygame.transform.rotate(head_img, self.angle)
+            self.head_imgs[key] = head_img
+            self.head_masks[key] = pygame.mask.from_surface(head_img)
+            if RENDER_SCALE == 1:
+                self.head_draw_imgs[key] = head_img
+            else:
+                draw_img = pygame.transform.flip(self.original_head_draw_img, *self.flip)
+                self.head_draw_imgs[key] = pygame.transform.rotate(draw_img, self.angle)
+        self.head_img = head_img
+        self.head_mask = self.head_masks[key]
+        self.head_draw_img = self.head_draw_imgs[key]
+
+    def _head_overlaps(self, rect, mask):
+        """Colisão da cabeça com um objeto: primeiro o teste barato de rects, depois (se passar) os pixels."""
+        if not self.rect.colliderect(rect):
+            return False
+        if not PIXEL_COLLISION or mask is None:
+            return True
+        #As partes transparentes dos cantos da sprite não contam como colisão
+        return self.head_mask.overlap(mask, (rect.x - self.rect.x, rect.y - self.rect.y)) is not None
 
     def grow(self):
         """Aumenta o placar (e consequentemente o corpo)."""
@@ -138,46 +247,148 @@ class Snake:
 
 
 
+    @property
+    def body_rects(self):
+        """Rects do corpo (do pescoço para a cauda), recriados a partir do histórico só quando mudaram."""
+        if not self._body_rects_valid:
+            self._update_body_rects()
+        return self._body_rects
+
     def _update_body_rects(self):
         """Cria os rects do corpo com base no histórico (para colisão)."""
-        self.body_rects.clear()
-        for i in range(self.score):
-            history_index = (i + 1) * BODY_SPACING
-            if history_index < len(self.position_history):
-                segment_pos = self.position_history[history_index]
-                body_rect = self.body_img.get_rect(center=segment_pos)
-                self.body_rects.append(body_rect)
-
-    def draw_body(self, surface):
-        """Desenha apenas o corpo na tela (usando os rects já calculados)."""
-        for rect in self.body_rects:
-            surface.blit(self.body_img, rect)
-
-    def draw_head(self, surface):
+        body_rects = self._body_rects
+        body_rects.clear()
+        #Só os segmentos que já têm posição no histórico (não percorre o placar inteiro)
+        segments = min(self.score, (len(self.position_history) - 1) // BODY_SPACING)
+        for i in range(segments):
+            segment_pos = self.position_history[(i + 1) * BODY_SPACING]
+            body_rects.append(self.body_img.get_rect(center=segment_pos))
+        self._body_rects_valid = True
+
+    def _remove_history_from_grid(self):
+        """Tira da grade só as posições desta cobra (a grade pode ser compartilhada com outras)."""
+        history, stamp = self._grid_history or (self.position_history, self.history_stamp)
+        self._grid_history = None
+        for i, pos in enumerate(history):
+            self.history_grid.remove((self, stamp - i), *pos)
+
+    def _rebuild_history_grid(self):
+        """Recoloca o histórico na grade (usado quando o estado é restaurado, depois de _remove_history_from_grid)."""
+        for i, pos in enumerate(self.position_history):
+            self.history_grid.insert((self, self.history_stamp - i), *pos, pos)
+
+    def detach_history(self):
+        """
+        Prepara a troca do histórico por fora (GameState.apply) sem mexer na grade: a lista atual fica guardada
+        como "o que está na grade" e position_history passa a ser uma lista nova. Ver sync_grid.
+        """
+        if self._grid_history is None:
+            self._grid_history = (self.position_history, self.history_stamp)
+            self.position_history = []
+
+    def sync_grid(self):
+        """Atualiza a grade com o histórico atual, se ele foi trocado desde a última vez (só custa algo nesse caso)."""
+        if self._grid_history is not None:
+            self._remove_history_from_grid()
+            self._rebuild_history_grid()
+
+    def body_segment_index(self, stamp):
+        """Número do segmento do corpo (0 = pescoço) na posição do histórico com esse número, ou None se não houver segmento ali."""
+        history_index = self.history_stamp - stamp
+        if 0 < history_index <= self.score * BODY_SPACING and history_index % BODY_SPACING == 0:
+            return history_index // BODY_SPACING - 1
+        return None
+
+    @property
+    def neck_segments(self):
+        """Quantos segmentos logo atrás da cabeça não contam na colisão com o próprio corpo."""
+        return int(self.turn_cooldown_distance / HISTORY_STEP) + 1
+
+    def segment_image(self, index):
+        """Imagem (na resolução interna) do segmento 'index' neste tick."""
+        if self.body_animation is None:
+            return self.body_draw_img
+        return self.body_animation.frame(self.anim_tick, -index)
+
+    def draw_segments(self, surface, camera, segments):
+        """Desenha os segmentos (número, rect) já selecionados, convertendo para a posição na tela."""
+        to_screen = camera.to_screen
+        for index, rect in segments:
+            surface.blit(self.segment_image(index), to_screen(rect.x, rect.y))
+
+    def draw_head(self, surface, camera=None):
         """Desenha apenas a cabeça na tela (por cima do corpo)."""
-        surface.blit(self.head_img, self.rect)
+        if camera is None:
+            surface.blit(self.head_img, self.rect)
+        else:
+            surface.blit(self.head_draw_img, camera.apply(self.rect))
 
-    def check_collision_food(self, food_rect):
-        """Verifica colisão com a comida."""
-        if self.rect.colliderect(food_rect):
-            self.grow()
-            return True
-        return False
+    def _sweep_hit(self, rect, mask, motion=(0, 0)):
+        """
+        Colisão contínua: a cabeça não "pula" de prev_rect para rect, ela percorre o caminho todo.
+        motion é quanto o objeto andou no mesmo tick (ele termina em rect); o teste é feito no movimento relativo.
+        Retorna a fração do movimento (0 a 1) em que a cabeça encosta no objeto, ou None se não encostar.
+        """
+        start = self.prev_rect
+        move_x, move_y = self.rect.x - start.x - motion[0], self.rect.y - start.y - motion[1]
+        #O objeto fica parado na posição do começo do tick e só a cabeça anda (movimento relativo)
+        if motion != (0, 0):
+            rect = rect.move(-motion[0], -motion[1])
+
+        #Teste barato: o objeto precisa estar dentro da área varrida pela cabeça
+        if not start.union(start.move(move_x, move_y)).colliderect(rect):
+            return None
+
+        #Swept AABB: intervalo de tempo em que os rects se sobrepõem em cada eixo
+        t_enter, t_exit = 0.0, 1.0
+        for move, a_min, a_max, b_min, b_max in ((move_x, start.left, start.right, rect.left, rect.right),
+                                                 (move_y, start.top, start.bottom, rect.top, rect.bottom)):
+            if move == 0:
+                if a_max <= b_min or a_min >= b_max:
+                    return None
+                continue
+            if move > 0:
+                enter, exit = (b_min - a_max) / move, (b_max - a_min) / move
+            else:
+                enter, exit = (b_max - a_min) / move, (b_min - a_max) / move
+            t_enter, t_exit = max(t_enter, enter), min(t_exit, exit)
+        if t_enter >= t_exit:
+            return None
+
+        if not PIXEL_COLLISION or mask is None:
+            return t_enter
+
+        #Refina com as máscaras, andando de 1 em 1 pixel dentro do intervalo em que os rects se sobrepõem
+        distance = max(abs(move_x), abs(move_y))
+        steps = int((t_exit - t_enter) * distance) + 1
+        for i in range(steps + 1):
+            t = min(t_enter + i / distance, t_exit) if distance else t_enter
+            offset = (rect.x - round(start.x + move_x * t), rect.y - round(start.y + move_y * t))
+            if self.head_mask.overlap(mask, offset) is not None:
+                return t
+        return None
+
+    def _move_head_to(self, t):
+        """Coloca a cabeça no ponto do caminho em que a colisão aconteceu."""
+        self.rect.topleft = (round(self.prev_rect.x + (self.rect.x - self.prev_rect.x) * t),
+                             round(self.prev_rect.y + (self.rect.y - self.prev_rect.y) * t))
+
+    def head_hit(self, rect, mask, motion=(0, 0)):
+        """
+        Colisão da cabeça (neste tick) com um objeto qualquer (que andou 'motion' no mesmo tick, como outra cabeça).
+        Retorna a fração do movimento em que encostou (0 sem colisão contínua) ou None.
+        """
+        if SWEPT_COLLISION:
+            return self._sweep_hit(rect, mask, motion)
+        return 0.0 if self._head_overlaps(rect, mask) else None
 
     def check_collision_wall(self):
         """Verifica colisão com as paredes."""
-        return (self.rect.left < 0 or
-                self.rect.right > SCREEN_WIDTH or
-                self.rect.top < 0 or
-                self.rect.bottom > SCREEN_HEIGHT)
-
-    def check_collision_self(self):
-        """Verifica colisão com o próprio corpo."""
-        # Pula os primeiros segmentos (para não colidir com o "pescoço")
-        ignore_segments = int(self.turn_cooldown_distance / SNAKE_SPEED) + 1 
-        
-        # Itera sobre os rects do corpo (exceto o pescoço)
-        for body_rect in self.body_rects[ignore_segments:]:
-            if self.rect.colliderect(body_rect):
-                return True
-        return False
\ No newline at end of file
+        hit = (self.rect.left < 0 or
+               self.rect.right > WORLD_WIDTH or
+               self.rect.top < 0 or
+               self.rect.bottom > WORLD_HEIGHT)
+        if hit and SWEPT_COLLISION:
+            #O movimento é sempre em um eixo só, então prender a cabeça no mundo a deixa encostada na parede
+            self.rect.clamp_ip(pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT))
+        return hit
\ No newline at end of file
@@ -0,0 +1,189 @@
+# soak.py
+# Teste de longa duração (soak) para as máquinas de quiosque: roda o jogo sem janela (driver "dummy" do SDL),
+# com um piloto automático, por muitas partidas seguidas e com a cobra bem comprida.
+# Mede a memória (tracemalloc e RSS) e o tempo de cada tick, e termina com erro se a memória crescer
+# ou se o p99 do tempo de tick piorar além dos limites.
+#
+# Uso: python soak.py --cycles 50 --length 50 --world-scale 3
+
+import os
+import sys
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import settings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Soak test do Snake - Isaac")
+    parser.add_argument("--cycles", type=int, default=8, help="Quantidade de partidas (reinícios)")
+    parser.add_argument("--warmup", type=int, default=2, help="Partidas ignoradas no início (caches sendo criados)")
+    parser.add_argument("--length", type=int, default=50,
+                        help="Placar inicial de cada partida (pequeno o bastante para o histórico chegar no limite e ser cortado)")
+    parser.add_argument("--world-scale", type=int, default=2, help="Tamanho do mundo em telas (para a cobra crescer mais)")
+    parser.add_argument("--check-every", type=int, default=100, help="A cada quantos ticks as invariantes são verificadas")
+    parser.add_argument("--max-mem-growth-kb", type=float, default=256, help="Crescimento máximo no tracemalloc")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=16, help="Crescimento máximo do RSS")
+    parser.add_argument("--max-p99-drift", type=float, default=1.5, help="Razão máxima entre o p99 do fim e do começo")
+    return parser.parse_args()
+
+
+def current_rss_mb():
+    """RSS atual do processo (Linux: /proc; nos outros sistemas usa o pico informado pelo resource)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def p99(samples):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+class AutoPilot:
+    """Percorre o mundo em zigue-zague (linhas horizontais), até bater na parede de baixo."""
+    ROW_HEIGHT = 60
+
+    def __init__(self, snake):
+        self.snake = snake
+        self.going_down_from = None
+
+    def _press(self, key):
+        self.snake.handle_input(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def step(self):
+        snake = self.snake
+        rect = snake.rect
+        margin = snake.rect.width
+        if self.going_down_from is not None:
+            if rect.centery - self.going_down_from >= self.ROW_HEIGHT:
+                self.going_down_from = None
+                self._press(pygame.K_LEFT if rect.centerx > settings.WORLD_WIDTH // 2 else pygame.K_RIGHT)
+        elif ((snake.direction == snake.DIR_RIGHT and rect.right + margin > settings.WORLD_WIDTH) or
+              (snake.direction == snake.DIR_LEFT and rect.left - margin < 0)):
+            self.going_down_from = rect.centery
+            self._press(pygame.K_DOWN)
+
+
+def check_invariants(game):
+    """As listas que crescem durante o jogo precisam continuar limitadas pelo placar."""
+    snake = game.snake
+    problems = []
+    if len(snake.position_history) > (snake.score + 2) * settings.BODY_SPACING:
+        problems.append("position_history passou do limite")
+    if len(snake.body_rects) > snake.score:
+        problems.append("body_rects maior que o placar")
+    #A grade é compartilhada por todas as cobras da arena (e depois de um restore só é refeita quando for usada)
+    game.arena.sync_grid()
+    grid_items = sum(len(bucket) for bucket in snake.history_grid.cells.values())
+    if grid_items != sum(len(other.position_history) for other in game.snakes):
+        problems.append("grade espacial fora de sincronia com o histórico")
+    if game.rewind_buffer is not None and game.rewind_buffer.count > game.rewind_buffer.capacity:
+        problems.append("rewind passou da capacidade")
+    return problems
+
+
+def main():
+    args = parse_args()
+    settings.WORLD_WIDTH = settings.SCREEN_WIDTH * args.world_scale
+    settings.WORLD_HEIGHT = settings.SCREEN_HEIGHT * args.world_scale
+    #Import depois de ajustar o tamanho do mundo (os módulos copiam as constantes no import)
+    from main import Game
+
+    game = Game()
+    failures = []
+    if not game.first_frame_within_budget():
+        failures.append(f"primeiro frame em {game.startup_times['first_frame']:.1f}ms "
+                        f"(orçamento {settings.FIRST_FRAME_BUDGET_MS}ms)")
+
+    tracemalloc.start()
+    cycles = []
+    for cycle in range(args.cycles):
+        random.seed(0) # Todas as partidas repetem o mesmo trajeto, para os tempos serem comparáveis
+        game._start_new_game()
+        game.snake.score = args.length
+        pilot = AutoPilot(game.snake)
+
+        tick_times = []
+        problems = set()
+        while game.game_state == "playing":
+            start = time.perf_counter()
+            pilot.step()
+            game._update()
+            game._draw()
+            tick_times.append((time.perf_counter() - start) * 1000)
+            if len(tick_times) % args.check_every == 0:
+                problems.update(check_invariants(game))
+        problems.update(check_invariants(game))
+        #Sem corte o caminho que tira posições do histórico e da grade não foi testado
+        if game.snake.history_stamp <= len(game.snake.position_history):
+            problems.add("o histórico nunca chegou no limite (diminua --length ou aumente --world-scale)")
+        for problem in sorted(problems):
+            failures.append(f"partida {cycle + 1}: {problem}")
+
+        cycles.append({
+            "ticks": len(tick_times),
+            "p99_ms": p99(tick_times),
+            "traced_kb": tracemalloc.get_traced_memory()[0] / 1024,
+            "rss_mb": current_rss_mb(),
+            "history": len(game.snake.position_history),
+        })
+        c = cycles[-1]
+        print(f"partida {cycle + 1:3d}: {c['ticks']} ticks, p99 {c['p99_ms']:.2f}ms, "
+              f"tracemalloc {c['traced_kb']:.0f}KB, RSS {c['rss_mb']:.1f}MB, histórico {c['history']}")
+
+    #Compara o começo (depois do aquecimento) com o fim
+    measured = cycles[args.warmup:]
+    if len(measured) < 2:
+        print("Partidas insuficientes para comparar (aumente --cycles).")
+        return 1
+    first, last = measured[0], measured[-1]
+    mem_growth = last["traced_kb"] - first["traced_kb"]
+    rss_growth = last["rss_mb"] - first["rss_mb"]
+    #O p99 de uma partida sozinha varia muito; compara a mediana do primeiro terço com a do último
+    window = max(1, len(measured) // 3)
+    p99_start = statistics.median(c["p99_ms"] for c in measured[:window])
+    p99_end = statistics.median(c["p99_ms"] for c in measured[-window:])
+    drift = p99_end / p99_start if p99_start else 1.0
+
+    print(f"\nCrescimento tracemalloc: {mem_growth:.1f}KB (limite {args.max_mem_growth_kb}KB)")
+    print(f"Crescimento RSS: {rss_growth:.1f}MB (limite {args.max_rss_growth_mb}MB)")
+    print(f"Drift do p99: {drift:.2f}x (limite {args.max_p99_drift}x)")
+
+    if mem_growth > args.max_mem_growth_kb:
+        failures.append(f"memória (tracemalloc) cresceu {mem_growth:.1f}KB")
+    if rss_growth > args.max_rss_growth_mb:
+        failures.append(f"RSS cresceu {rss_growth:.1f}MB")
+    if drift > args.max_p99_drift:
+        failures.append(f"p99 do tick piorou {drift:.2f}x")
+
+    if game.telemetry is not None:
+        game.telemetry.close()
+    if game.capture is not None:
+        game.capture.stop()
+    if game.compositor is not None:
+        game.compositor.close()
+    pygame.quit()
+
+    if failures:
+        print("\nFALHOU:")
+        for failure in failures:
+            print(f"- {failure}")
+        return 1
+    print("\nOK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
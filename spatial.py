@@ -0,0 +1,44 @@
+# spatial.py
+# Grade espacial uniforme: divide o mundo em células e guarda em cada célula os itens que estão nela.
+# Assim, para saber o que existe numa região (por exemplo a área visível da câmera) só as células daquela região são visitadas.
+
+from settings import SPATIAL_CELL_SIZE
+
+class SpatialGrid:
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        #Dicionário (coluna, linha) -> {chave: valor}
+        self.cells = {}
+
+    def _cell(self, x, y):
+        return (int(x) // self.cell_size, int(y) // self.cell_size)
+
+    def insert(self, key, x, y, value=None):
+        cell = self._cell(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = {}
+        bucket[key] = value
+
+    def remove(self, key, x, y):
+        cell = self._cell(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+
+    def query(self, rect):
+        """Retorna (chave, valor) de todos os itens nas células que encostam no rect."""
+        size = self.cell_size
+        first_col, first_row = rect.left // size, rect.top // size
+        last_col, last_row = (rect.right - 1) // size, (rect.bottom - 1) // size
+        cells = self.cells
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    yield from bucket.items()
\ No newline at end of file
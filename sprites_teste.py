@@ -2,6 +2,9 @@ import pygame
 import json
 import os
 import sys
+import argparse
+from bisect import bisect_right
+from collections import OrderedDict
 
 # --- CLASSE SPRITESHEET (Copiada do jogo principal) ---
 # (Com melhorias para transparência de PNG)
@@ -47,20 +50,14 @@ SCREEN_HEIGHT = 600
 COLOR_BACKGROUND = (50, 50, 50) # Cinza escuro
 COLOR_WHITE = (255, 255, 255)
 COLOR_ERROR = (255, 100, 100) # Vermelho claro para erros
+COLOR_SEARCH_BAR = (30, 30, 30)
 
-# --- 2. Inicialização do Pygame ---
-pygame.init()
-pygame.font.init()
-
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Visualizador de Spritesheet")
-clock = pygame.time.Clock()
-
-# Fontes para desenhar os nomes e mensagens de erro
-font_sprite_name = pygame.font.Font(None, 24)
-font_error = pygame.font.Font(None, 30)
-
-# --- 3. Lógica de Carregamento de Assets ---
+SEARCH_BAR_HEIGHT = 40
+PADDING_X = 20
+ROW_SPACING = 10 # Espaçamento entre as sprites
+SCROLL_STEP = 40
+MAX_CACHED_SPRITES = 256 # Sprites recortadas mantidas em memória (as menos usadas são descartadas)
+MAX_CACHED_LABELS = 256 # Textos dos nomes mantidos em memória (mesma regra das sprites)
 
 # --- CONFIGURAÇÃO DO CAMINHO (Exatamente como no jogo) ---
 try:
@@ -72,35 +69,114 @@ ASSET_PATH = os.path.join(script_dir, 'assets')
 SPRITESHEET_FILENAME = 'snake_sprites.png' # Nome do seu arquivo de sprites
 # ---------------------------------------------------
 
-full_spritesheet_path = os.path.join(ASSET_PATH, SPRITESHEET_FILENAME)
+parser = argparse.ArgumentParser(description="Visualizador de Spritesheet")
+parser.add_argument("spritesheet", nargs="?", default=os.path.join(ASSET_PATH, SPRITESHEET_FILENAME),
+                    help="Caminho do .png (o .json precisa ter o mesmo nome)")
+parser.add_argument("--validate", action="store_true",
+                    help="Sem janela: só confere se todos os frames estão dentro da imagem")
+args = parser.parse_args()
+
+full_spritesheet_path = args.spritesheet
+
+
+def validate_atlas(png_path):
+    """Confere todos os frames (e animações) do JSON contra o tamanho do PNG. Retorna a lista de erros."""
+    json_path = png_path.replace('.png', '.json')
+    with open(json_path) as f:
+        data = json.load(f)
+    #Só lê o tamanho da imagem, não precisa de janela
+    sheet_w, sheet_h = pygame.image.load(png_path).get_size()
+
+    errors = []
+    frames = data.get('frames', {})
+    for name, frame_data in frames.items():
+        try:
+            frame = frame_data['frame']
+            x, y, w, h = frame["x"], frame["y"], frame["w"], frame["h"]
+        except (KeyError, TypeError):
+            errors.append(f"'{name}': frame sem x/y/w/h")
+            continue
+        if w <= 0 or h <= 0:
+            errors.append(f"'{name}': tamanho inválido ({w}x{h})")
+        elif x < 0 or y < 0 or x + w > sheet_w or y + h > sheet_h:
+            errors.append(f"'{name}': ({x}, {y}, {w}, {h}) fora da imagem ({sheet_w}x{sheet_h})")
+
+    for anim_name, anim_data in data.get('animations', {}).items():
+        for frame_name in anim_data.get('frames', []):
+            if frame_name not in frames:
+                errors.append(f"animação '{anim_name}': frame '{frame_name}' não existe")
+    return errors, len(frames)
+
+
+# --- 2. Modo de validação (sem janela) ---
+if args.validate:
+    try:
+        errors, frame_count = validate_atlas(full_spritesheet_path)
+    except (pygame.error, FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Erro ao abrir a spritesheet: {e}")
+        sys.exit(2)
+    for error in errors:
+        print(f"- {error}")
+    print(f"{frame_count} frames verificados, {len(errors)} erro(s).")
+    sys.exit(1 if errors else 0)
+
+# --- 3. Inicialização do Pygame ---
+pygame.display.init()
+pygame.font.init()
+
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+pygame.display.set_caption("Visualizador de Spritesheet")
+clock = pygame.time.Clock()
+
+# Fontes para desenhar os nomes e mensagens de erro
+font_sprite_name = pygame.font.Font(None, 24)
+font_error = pygame.font.Font(None, 30)
+
+def build_rows(search):
+    """
+    Layout da lista filtrada: para cada sprite, seu nome, tamanho e a posição Y do topo da linha.
+    Usa só os tamanhos do JSON, então não recorta nenhuma imagem.
+    """
+    search = search.lower()
+    frames = my_spritesheet.data['frames']
+    rows = []
+    row_tops = []
+    current_y = ROW_SPACING
+    min_row_height = font_sprite_name.get_height()
+    for name in frame_names:
+        if search and search not in name.lower():
+            continue
+        frame = frames[name]['frame']
+        rows.append((name, frame["w"], frame["h"]))
+        row_tops.append(current_y)
+        current_y += max(frame["h"], min_row_height) + ROW_SPACING
+    return rows, row_tops, current_y
+
+# --- 4. Lógica de Carregamento de Assets ---
+# Apenas a imagem e o JSON são carregados aqui. As sprites só são recortadas quando aparecem na tela.
 
-# Lista para guardar as imagens carregadas e seus nomes
-loaded_sprites = []
+frame_names = []
 loading_failed = False
 error_message = ""
+search_text = ""
 
 try:
     print(f"Carregando spritesheet de: {full_spritesheet_path}")
     my_spritesheet = Spritesheet(full_spritesheet_path)
+    frame_names = list(my_spritesheet.data['frames'].keys())
     
-    # --- LÓGICA PRINCIPAL DESTE SCRIPT ---
-    # Itera sobre TODOS os 'frames' definidos no arquivo JSON
-    
-    # .data['frames'] é o dicionário principal no seu JSON
-    # .keys() pega o nome de cada sprite (ex: 'head', 'body', 'food')
-    
-    print("Elementos encontrados no JSON:")
-    for sprite_name in my_spritesheet.data['frames'].keys():
-        print(f"- {sprite_name}")
-        # Carrega a imagem da sprite usando o nome
-        image = my_spritesheet.parse_sprite(sprite_name)
-        # Adiciona a imagem e seu nome na lista para desenhar
-        loaded_sprites.append((image, sprite_name))
-    
-    if not loaded_sprites:
+    if not frame_names:
         raise ValueError("JSON carregado, mas nenhum 'frame' foi encontrado.")
-        
-    print(f"\nSucesso! {len(loaded_sprites)} sprites carregadas.")
+
+    # Confere os frames antes de montar a lista (um frame sem x/y/w/h quebraria o desenho)
+    errors, _ = validate_atlas(full_spritesheet_path)
+    if errors:
+        for error in errors:
+            print(f"- {error}")
+        raise ValueError(f"{len(errors)} frame(s) com erro no JSON, o primeiro: {errors[0]}")
+
+    rows, row_tops, content_height = build_rows(search_text)
+    print(f"\nSucesso! {len(frame_names)} sprites encontradas.")
 
 except Exception as e:
     # Se qualquer coisa der errado (arquivo não encontrado, JSON mal formatado)
@@ -111,17 +187,74 @@ except Exception as e:
     loading_failed = True
     error_message = str(e)
 
+# Caches: sprites recortadas e textos dos nomes (os dois limitados, LRU)
+sprite_cache = OrderedDict()
+label_cache = OrderedDict()
 
-# --- 4. Loop Principal (Apenas para Desenhar) ---
+def get_sprite(name):
+    image = sprite_cache.get(name)
+    if image is None:
+        image = my_spritesheet.parse_sprite(name)
+        sprite_cache[name] = image
+        if len(sprite_cache) > MAX_CACHED_SPRITES:
+            sprite_cache.popitem(last=False)
+    else:
+        sprite_cache.move_to_end(name)
+    return image
+
+def get_label(name, w, h):
+    label = label_cache.get(name)
+    if label is None:
+        label = font_sprite_name.render(f"Nome: '{name}' (Tam: {w}x{h}px)", True, COLOR_WHITE)
+        label_cache[name] = label
+        if len(label_cache) > MAX_CACHED_LABELS:
+            label_cache.popitem(last=False)
+    else:
+        label_cache.move_to_end(name)
+    return label
+
+scroll_y = 0
+view_height = SCREEN_HEIGHT - SEARCH_BAR_HEIGHT
+search_surf = None
+
+
+# --- 5. Loop Principal (Apenas para Desenhar) ---
 running = True
 while running:
     # --- Tratamento de Eventos ---
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
-        if event.type == pygame.KEYDOWN:
+        elif event.type == pygame.MOUSEWHEEL:
+            scroll_y -= event.y * SCROLL_STEP
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE: # Permite sair com a tecla ESC
                 running = False
+            elif event.key == pygame.K_DOWN:
+                scroll_y += SCROLL_STEP
+            elif event.key == pygame.K_UP:
+                scroll_y -= SCROLL_STEP
+            elif event.key == pygame.K_PAGEDOWN:
+                scroll_y += view_height
+            elif event.key == pygame.K_PAGEUP:
+                scroll_y -= view_height
+            elif event.key == pygame.K_HOME:
+                scroll_y = 0
+            elif event.key == pygame.K_END:
+                scroll_y = 1 << 30
+            elif not loading_failed:
+                # Busca por nome: digitar filtra a lista, Backspace apaga
+                if event.key == pygame.K_BACKSPACE:
+                    new_search = search_text[:-1]
+                elif event.unicode and event.unicode.isprintable():
+                    new_search = search_text + event.unicode
+                else:
+                    new_search = search_text
+                if new_search != search_text:
+                    search_text = new_search
+                    rows, row_tops, content_height = build_rows(search_text)
+                    scroll_y = 0
+                    search_surf = None
 
     # --- Lógica de Desenho ---
     screen.fill(COLOR_BACKGROUND)
@@ -137,34 +270,40 @@ while running:
         screen.blit(help_surf, (20, 120))
         
     else:
-        # Desenha todas as sprites carregadas
-        current_y = 20 # Posição Y inicial
-        padding_x = 20
-        
-        for image, name in loaded_sprites:
+        scroll_y = max(0, min(scroll_y, content_height - view_height))
+
+        # Desenha só as sprites que aparecem na tela (busca binária pela primeira linha visível)
+        first = max(0, bisect_right(row_tops, scroll_y) - 1)
+        for i in range(first, len(rows)):
+            row_y = SEARCH_BAR_HEIGHT + row_tops[i] - scroll_y
+            if row_y >= SCREEN_HEIGHT:
+                break
+            name, img_width, img_height = rows[i]
+
             # 1. Desenha a imagem da sprite
-            screen.blit(image, (padding_x, current_y))
+            screen.blit(get_sprite(name), (PADDING_X, row_y))
             
             # 2. Desenha o nome da sprite e suas dimensões ao lado
-            img_width = image.get_width()
-            img_height = image.get_height()
-            
-            text = f"Nome: '{name}' (Tam: {img_width}x{img_height}px)"
-            text_surf = font_sprite_name.render(text, True, COLOR_WHITE)
+            text_surf = get_label(name, img_width, img_height)
             
             # Calcula a posição do texto (à direita da imagem, centralizado verticalmente)
-            text_x = padding_x + img_width + 15
-            text_y = current_y + (img_height / 2) - (text_surf.get_height() / 2)
+            row_height = max(img_height, text_surf.get_height())
+            text_x = PADDING_X + img_width + 15
+            text_y = row_y + (row_height / 2) - (text_surf.get_height() / 2)
             
             screen.blit(text_surf, (text_x, text_y))
-            
-            # 3. Atualiza a posição Y para a próxima sprite
-            current_y += img_height + 10 # Adiciona 10 pixels de espaçamento
+
+        # Barra de busca (por cima da lista)
+        if search_surf is None:
+            search_surf = font_sprite_name.render(
+                f"Buscar: {search_text}_   ({len(rows)}/{len(frame_names)} sprites)", True, COLOR_WHITE)
+        screen.fill(COLOR_SEARCH_BAR, (0, 0, SCREEN_WIDTH, SEARCH_BAR_HEIGHT))
+        screen.blit(search_surf, (PADDING_X, (SEARCH_BAR_HEIGHT - search_surf.get_height()) // 2))
 
     # Atualiza a tela
     pygame.display.flip()
     clock.tick(30)
 
-# --- 5. Fim ---
+# --- 6. Fim ---
 pygame.quit()
 sys.exit()
\ No newline at end of file
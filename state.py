@@ -0,0 +1,137 @@
+# state.py
+# Representação compacta do estado completo do jogo (cobras + comidas), para clonar o jogo milhares de vezes por segundo
+# (bots fazendo lookahead) e para voltar no tempo (rewind).
+# Em vez de copiar Vector2, Rects e listas de tuplas, o estado fica em __slots__ e o histórico de posições
+# de cada cobra em um único array de inteiros (x0, y0, x1, y1, ...).
+
+from array import array
+from itertools import chain
+
+import pygame
+
+class SnakeState:
+    __slots__ = ('head', 'direction', 'angle', 'flip', 'pending', 'last_turn_position',
+                 'last_direction', 'score', 'history', 'path_carry')
+
+    def __init__(self):
+        self.head = (0, 0, 0, 0)
+        self.direction = (0.0, 0.0)
+        self.angle = 0
+        self.flip = (False, False)
+        #Curva pendente: None ou (dx, dy, angulo, flip)
+        self.pending = None
+        self.last_turn_position = (0, 0)
+        self.last_direction = (0.0, 0.0)
+        self.score = 0
+        self.history = array('i')
+        self.path_carry = 0.0
+
+    def capture(self, snake):
+        self.head = tuple(snake.rect)
+        self.direction = tuple(snake.direction)
+        self.angle = snake.angle
+        self.flip = snake.flip
+        if snake.pending_direction is None:
+            self.pending = None
+        else:
+            self.pending = (*snake.pending_direction, snake.pending_angle, snake.pending_flip)
+        self.last_turn_position = snake.last_turn_position
+        self.last_direction = tuple(snake.last_direction)
+        self.score = snake.score
+        self.path_carry = snake.path_carry
+
+        history = self.history
+        del history[:]
+        history.extend(chain.from_iterable(snake.position_history))
+
+    def apply(self, snake):
+        #A grade não é mexida aqui: ela é atualizada só quando for usada de novo (Snake.sync_grid),
+        #então vários restores seguidos (lookahead) não pagam a reconstrução da grade
+        snake.detach_history()
+
+        snake.rect.update(self.head)
+        snake.prev_rect.update(self.head)
+        snake.direction = pygame.math.Vector2(self.direction)
+        snake.angle = self.angle
+        snake.flip = self.flip
+        if self.pending is None:
+            snake.pending_direction = None
+            snake.pending_angle = None
+            snake.pending_flip = (False, False)
+        else:
+            dx, dy, snake.pending_angle, snake.pending_flip = self.pending
+            snake.pending_direction = pygame.math.Vector2(dx, dy)
+        snake.last_turn_position = self.last_turn_position
+        snake.last_direction = pygame.math.Vector2(self.last_direction)
+        snake.score = self.score
+        snake.path_carry = self.path_carry
+
+        history = self.history
+        snake.position_history[:] = zip(history[0::2], history[1::2])
+        snake._update_head_img()
+        snake._body_rects_valid = False
+
+class GameState:
+    __slots__ = ('snakes', 'foods', 'game_state')
+
+    def __init__(self):
+        #Um SnakeState por cobra (criados na primeira captura e reaproveitados)
+        self.snakes = []
+        #Centros das comidas (x0, y0, x1, y1, ...)
+        self.foods = array('i')
+        self.game_state = "playing"
+
+    def capture(self, game):
+        """Copia o estado do jogo para este objeto (reaproveitando o próprio objeto, sem criar um novo)."""
+        states = self.snakes
+        while len(states) < len(game.snakes):
+            states.append(SnakeState())
+        del states[len(game.snakes):]
+        for state, snake in zip(states, game.snakes):
+            state.capture(snake)
+
+        foods = self.foods
+        del foods[:]
+        foods.extend(chain.from_iterable(food.rect.center for food in game.foods))
+        self.game_state = game.game_state
+        return self
+
+    def apply(self, game):
+        """Restaura este estado no jogo (O(tamanho das cobras))."""
+        for state, snake in zip(self.snakes, game.snakes):
+            state.apply(snake)
+
+        foods = self.foods
+        for i, food in enumerate(game.foods):
+            food.rect.center = (foods[2 * i], foods[2 * i + 1])
+        game.arena.sync_foods()
+        game.game_state = self.game_state
+
+class RewindBuffer:
+    """Anel com os últimos N snapshots. Os GameState são criados uma vez e reaproveitados, então a memória fica limitada."""
+    def __init__(self, capacity):
+        self.states = [GameState() for _ in range(capacity)]
+        self.capacity = capacity
+        self.start = 0
+        self.count = 0
+
+    def push(self, game):
+        index = (self.start + self.count) % self.capacity
+        self.states[index].capture(game)
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def rewind(self, game, frames):
+        """Volta 'frames' snapshots (ou o máximo disponível) e aplica no jogo. Retorna False se o anel estiver vazio."""
+        if self.count == 0:
+            return False
+        self.count = max(1, self.count - frames)
+        index = (self.start + self.count - 1) % self.capacity
+        self.states[index].apply(game)
+        return True
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
\ No newline at end of file
@@ -0,0 +1,119 @@
+# telemetry.py
+# Métricas da sessão (placar, curvas, curvas em U recusadas, causa da morte e tempo de frame).
+# O jogo só escreve números em arrays pré-alocados (um anel); uma thread separada, de tempos em tempos,
+# lê o que foi escrito e grava em arquivos JSONL ou CSV que são trocados (rotacionados) ao passar de um tamanho.
+# Com a telemetria desligada, Game e Snake guardam None e só fazem um "if", nada é alocado.
+
+import os
+import threading
+import time
+import json
+from array import array
+
+from settings import (TELEMETRY_DIR, TELEMETRY_FORMAT, TELEMETRY_BUFFER_SIZE,
+                      TELEMETRY_FLUSH_INTERVAL, TELEMETRY_MAX_FILE_BYTES)
+
+# Tipos de evento (o número é o que fica no anel; o nome é o que vai para o arquivo)
+EVENT_GAME_START = 0
+EVENT_SCORE = 1
+EVENT_TURN = 2
+EVENT_U_TURN_REJECTED = 3
+EVENT_DEATH = 4
+EVENT_FRAME_TIME = 5
+EVENT_NAMES = ('game_start', 'score', 'turn', 'u_turn_rejected', 'death', 'frame_time')
+
+# Valor do evento de morte
+DEATH_WALL = 0
+DEATH_SELF = 1
+DEATH_SNAKE = 2 # Bateu no corpo de outra cobra
+DEATH_HEAD = 3 # Cabeça com cabeça
+DEATH_CAUSES = ('wall', 'self', 'snake', 'head')
+
+class Telemetry:
+    def __init__(self, out_dir=TELEMETRY_DIR, file_format=TELEMETRY_FORMAT, capacity=TELEMETRY_BUFFER_SIZE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL, max_file_bytes=TELEMETRY_MAX_FILE_BYTES):
+        if file_format not in ('jsonl', 'csv'):
+            raise ValueError(f"Formato de telemetria desconhecido: {file_format}")
+        self.out_dir = out_dir
+        self.file_format = file_format
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.session = time.strftime("%Y%m%d_%H%M%S")
+
+        #Anel: três arrays paralelos com tamanho fixo (tempo, tipo, valor)
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._kinds = array('b', bytes(capacity))
+        self._values = array('d', bytes(8 * capacity))
+        #Só o jogo altera _write e só a thread altera _read, então não é preciso lock
+        self._write = 0
+        self._read = 0
+        self.dropped_events = 0
+        self._start_time = time.perf_counter()
+
+        self._file = None
+        self._file_index = 0
+        os.makedirs(out_dir, exist_ok=True)
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name="Telemetry", daemon=True)
+        self._thread.start()
+
+    def emit(self, kind, value=0.0):
+        """Registra um evento. Se a thread de escrita estiver atrasada e o anel cheio, o evento é descartado."""
+        write = self._write
+        if write - self._read >= self.capacity:
+            self.dropped_events += 1
+            return
+        slot = write % self.capacity
+        self._times[slot] = time.perf_counter() - self._start_time
+        self._kinds[slot] = kind
+        self._values[slot] = value
+        self._write = write + 1
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        write = self._write
+        if write == self._read:
+            return
+        lines = []
+        for i in range(self._read, write):
+            slot = i % self.capacity
+            kind = self._kinds[slot]
+            value = self._values[slot]
+            if kind == EVENT_DEATH:
+                value = DEATH_CAUSES[int(value)]
+            if self.file_format == 'jsonl':
+                lines.append(json.dumps({"t": round(self._times[slot], 4), "event": EVENT_NAMES[kind], "value": value}))
+            else:
+                lines.append(f"{self._times[slot]:.4f},{EVENT_NAMES[kind]},{value}")
+        #Libera o espaço do anel antes de escrever no disco
+        self._read = write
+
+        self._rotate_if_needed()
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def _rotate_if_needed(self):
+        if self._file is not None and self._file.tell() < self.max_file_bytes:
+            return
+        if self._file is not None:
+            self._file.close()
+        self._file_index += 1
+        path = os.path.join(self.out_dir, f"telemetry_{self.session}_{self._file_index:03d}.{self.file_format}")
+        self._file = open(path, 'w')
+        if self.file_format == 'csv':
+            self._file.write("t,event,value\n")
+
+    def close(self):
+        """Grava o que ainda estiver no anel e encerra a thread."""
+        self._stop.set()
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+        if self.dropped_events:
+            print(f"Telemetria: {self.dropped_events} eventos descartados (anel cheio)")
\ No newline at end of file
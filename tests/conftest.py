@@ -0,0 +1,9 @@
+# conftest.py
+# Os testes rodam sem janela (driver "dummy" do SDL) e importam os módulos da raiz do projeto.
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
@@ -0,0 +1,39 @@
+# test_animation.py
+# Uma animação com erro no JSON é ignorada sozinha, sem derrubar as outras.
+
+import pygame
+import pytest
+
+from animation import load_animations
+
+
+class FakeSpritesheet:
+    def __init__(self, animations):
+        self.data = {'animations': animations}
+
+    def parse_sprite(self, name):
+        if name == 'missing':
+            raise KeyError(name)
+        return pygame.Surface((10, 10))
+
+
+@pytest.fixture(autouse=True)
+def display():
+    #convert_alpha precisa de uma tela
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+def test_bad_animation_is_skipped():
+    animations = load_animations(FakeSpritesheet({
+        'body': {'frames': ['body', 'body2'], 'frame_time': 4},
+        'sparkle': {'frames': ['sparkle']},
+        'glow': {'frames': ['glow'], 'size': 'giant'},
+        'broken': {'frames': ['missing'], 'size': 'food'},
+        'food_pulse': {'frames': ['food'], 'size': 'food'},
+    }))
+
+    assert sorted(animations) == ['body', 'food_pulse']
+    assert len(animations['body'].frames) == 2
\ No newline at end of file
@@ -0,0 +1,73 @@
+# test_collision.py
+# Colisões com velocidade alta: a cabeça não pode atravessar um corpo entre um tick e outro.
+
+import pygame
+import pytest
+
+import arena as arena_module
+import snake as snake_module
+from arena import Arena
+from snake import Snake
+from telemetry import DEATH_SELF, DEATH_HEAD
+
+
+def set_speed(monkeypatch, speed):
+    #Os módulos copiam as constantes no import, então elas são trocadas direto nos módulos que as usam
+    monkeypatch.setattr(snake_module, "SNAKE_SPEED", speed)
+    monkeypatch.setattr(arena_module, "SNAKE_SPEED", speed)
+
+
+@pytest.fixture
+def fast_world(monkeypatch):
+    set_speed(monkeypatch, 40)
+    monkeypatch.setattr(snake_module, "WORLD_WIDTH", 4000)
+    monkeypatch.setattr(snake_module, "WORLD_HEIGHT", 4000)
+
+
+def make_snake(arena, start_pos):
+    snake = Snake(pygame.Surface((35, 35)), pygame.Surface((27, 22)), grid=arena.grid)
+    snake.reset(start_pos)
+    arena.add_snake(snake)
+    return snake
+
+
+def run(arena, snake, key, ticks):
+    """Vira (se key não for None) e anda 'ticks' ticks. Retorna a causa da morte ou None."""
+    if key is not None:
+        snake.request_turn(key)
+    for _ in range(ticks):
+        snake.update()
+        _, deaths = arena.resolve()
+        if snake in deaths:
+            return deaths[snake]
+    return None
+
+
+@pytest.mark.parametrize("left_ticks", range(4, 10))
+def test_fast_head_does_not_tunnel_through_own_body(fast_world, left_ticks):
+    arena = Arena()
+    snake = make_snake(arena, (1000, 1000))
+    snake.score = 60
+
+    #Corpo horizontal em y=1000, depois um retângulo que volta cruzando esse corpo de baixo para cima
+    assert run(arena, snake, None, 30) is None
+    assert run(arena, snake, pygame.K_DOWN, 3) is None
+    assert run(arena, snake, pygame.K_LEFT, left_ticks) is None
+    assert run(arena, snake, pygame.K_UP, 10) == DEATH_SELF
+    #A cabeça para antes de chegar do outro lado do corpo
+    assert snake.rect.centery > 1000
+
+def test_fast_heads_do_not_swap_places(fast_world, monkeypatch):
+    set_speed(monkeypatch, 100)
+    arena = Arena()
+    left = make_snake(arena, (1000, 1000))
+    right = make_snake(arena, (1050, 1000))
+    #Uma indo para a direita e a outra para a esquerda, uma de frente para a outra (sem espaço para virar)
+    right.direction = right.last_direction = right.DIR_LEFT
+
+    left.update()
+    right.update()
+    _, deaths = arena.resolve()
+
+    assert deaths == {left: DEATH_HEAD, right: DEATH_HEAD}
+    assert left.rect.centerx < right.rect.centerx
\ No newline at end of file
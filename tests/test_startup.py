@@ -0,0 +1,21 @@
+# test_startup.py
+# O primeiro frame precisa aparecer dentro do orçamento de FIRST_FRAME_BUDGET_MS.
+
+import pygame
+import pytest
+
+from main import Game
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    yield game
+    if game.compositor is not None:
+        game.compositor.close()
+    pygame.quit()
+
+
+def test_first_frame_within_budget(game):
+    assert "first_frame" in game.startup_times
+    assert game.first_frame_within_budget(), game.startup_times
\ No newline at end of file